@@ -3,10 +3,19 @@ import asyncio
 import json
 import base64
 from pathlib import Path
-from typing import Dict, List, Optional
-import tempfile
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import functools
+import hashlib
 import os
+import shutil
+import subprocess
+import atexit
+import threading
+import weakref
 from datetime import datetime
+import httpx
+import ijson
+from openai import AsyncOpenAI
 
 # AI Framework imports
 from agno import Agent, Agno
@@ -14,11 +23,171 @@ from crewai import Agent as CrewAgent, Task, Crew, Process
 from langchain_openai import ChatOpenAI
 import google.generativeai as genai
 
+# LLM output caching
+from llm_cache import LLMCache, cached_llm_call
+
+# Keep-alive Blender render workers
+from render_workers import BlenderWorkerPool
+
+# Handwritten Blender templates
+from blender_templates import (
+    QUALITY_PRESETS,
+    create_biology_scene,
+    create_chemistry_scene,
+    create_history_scene,
+    create_mathematics_scene,
+    create_physics_scene,
+)
+
 # Video and 3D processing
 import bpy
 import bmesh
 from mathutils import Vector
-import subprocess
+
+# Finished scripts are kept under their content hash and run as modules, so
+# Blender's own Python compiles each one once and reuses the bytecode it
+# writes to __pycache__ on later runs
+SCRIPT_CACHE_DIR = Path(".script_cache")
+
+def cache_script(script: str) -> str:
+    """Write a script once under its content hash and return its module name"""
+    module = f"script_{hashlib.sha1(script.encode()).hexdigest()}"
+    path = SCRIPT_CACHE_DIR / f"{module}.py"
+    if not path.exists():
+        SCRIPT_CACHE_DIR.mkdir(exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_text(script)
+        partial.replace(path)
+    return module
+
+# Agent models; cache entries are namespaced by model so switching a model
+# invalidates its cached outputs. Only scene design needs the large model.
+ANALYZER_MODEL = "gpt-4o-mini"
+SCENE_DESIGNER_MODEL = "gpt-4"
+VIDEO_GENERATOR_MODEL = "gpt-4o-mini"
+
+# Output token caps per call
+ANALYZER_MAX_TOKENS = 800
+SCENE_DESIGNER_MAX_TOKENS = 3000
+ANALYSIS_CACHE_NAMESPACE = f"analysis:{ANALYZER_MODEL}"
+SCENE_CACHE_NAMESPACE = f"scene:{SCENE_DESIGNER_MODEL}"
+TEMPLATE_CACHE_NAMESPACE = f"template:{SCENE_DESIGNER_MODEL}"
+
+# Analysis fields the scene designer needs; the analyzer emits these first so
+# scene design can start while the rest of the analysis is still decoding
+SCENE_FIELDS = ("key_concepts", "objects", "animations", "camera_movements")
+
+def compact_json(data) -> str:
+    """Serialize prompt data without indentation to save prompt tokens"""
+    return json.dumps(data, separators=(",", ":"))
+
+def analysis_cache_key(topic: str, subject: str, level: str) -> tuple:
+    return (topic, subject, level)
+
+def analysis_semantic_key(topic: str, subject: str, level: str) -> tuple:
+    # Near-duplicate topics only match within the same subject and level
+    return (f"{subject}|{level}", topic)
+
+def scene_cache_key(analysis: Dict, quality: str) -> tuple:
+    return (quality, json.dumps(analysis, sort_keys=True))
+
+def template_cache_key(analysis: Dict, topic: str, subject: str) -> tuple:
+    return (subject, topic, json.dumps(analysis, sort_keys=True))
+
+# Keyframe steps consumed by bake_keyframes in every template
+STEPS_SCHEMA = (
+    '"steps": [{"frame": int, "transforms": {"<object name>": '
+    '{"location": [x, y, z], "rotation": [x, y, z] in radians, "scale": [x, y, z]}}}]'
+)
+
+# Subjects with a handwritten template only need the LLM to fill in the
+# template's data arguments; other subjects fall back to an LLM-authored script
+TEMPLATE_MAP = {
+    "Physics": (create_physics_scene, {
+        "objects": '[{"type": "sphere" | "cube", "name": str, "location": [x, y, z], '
+                   '"radius": float (spheres), "size": float (cubes), "color": [r, g, b, a]}]',
+        "animations": '[{"object": str, "type": str, "duration": int}]'
+    }),
+    "Chemistry": (create_chemistry_scene, {
+        "molecules": '[{"name": str, "atoms": [{"element": str, "position": [x, y, z], '
+                     '"radius": float, "color": [r, g, b, a]}], "bonds": [{"id": int, '
+                     '"center": [x, y, z], "length": float, "rotation": [x, y, z]}]}]',
+        # Molecule names animate the whole molecule as one rigid group
+        "reactions": f'[{{"name": str, {STEPS_SCHEMA}}}]'
+    }),
+    "Biology": (create_biology_scene, {
+        "structures": '[{"type": "cell", "name": str, "location": [x, y, z], "radius": float, '
+                      '"organelles": [{"name": str, "position": [x, y, z], "radius": float, '
+                      '"color": [r, g, b, a]}]} | {"type": "dna", "length": int}]',
+        "processes": f'[{{"name": str, {STEPS_SCHEMA}}}]'
+    }),
+    "Mathematics": (create_mathematics_scene, {
+        "shapes": '[{"type": "geometric_solid", "shape": "cube" | "sphere" | "cylinder", '
+                  '"name": str, "location": [x, y, z], "size": float (cubes), '
+                  '"radius": float, "height": float (cylinders), "color": [r, g, b, a]} '
+                  '| {"type": "function_surface", "name": str}]',
+        "equations": f'[{{"name": str, {STEPS_SCHEMA}}}]'
+    }),
+    "History": (create_history_scene, {
+        "structures": '[{"type": "building", "name": str, "location": [x, y, z], "size": float, '
+                      '"details": [{"name": str, "position": [x, y, z], "size": float, '
+                      '"color": [r, g, b, a]}]} | {"type": "monument", "name": str, '
+                      '"location": [x, y, z], "radius": float, "height": float}]',
+        "timeline": f'[{{"event": str, {STEPS_SCHEMA}}}]'
+    })
+}
+
+# Animation length the scene scripts render (10 seconds at 30fps); the range is
+# split into one contiguous shard per render worker
+FRAME_START = 1
+FRAME_END = 300
+VIDEO_FPS = 30
+
+# Seconds to wait on nvidia-smi or ffmpeg when probing the machine at startup
+PROBE_TIMEOUT = 10
+
+def count_render_devices() -> int:
+    """Count the NVIDIA GPUs available for parallel render workers"""
+    if shutil.which("nvidia-smi") is None:
+        return 1
+    try:
+        result = subprocess.run(
+            ["nvidia-smi", "--list-gpus"], capture_output=True, text=True, timeout=PROBE_TIMEOUT
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        gpus = 0
+    else:
+        # A failing nvidia-smi prints errors, not GPUs
+        gpus = len(result.stdout.splitlines()) if result.returncode == 0 else 0
+    # Without a usable GPU everything renders on one worker
+    return max(1, gpus)
+
+@functools.lru_cache(maxsize=None)
+def video_encoder() -> Tuple[str, ...]:
+    """Encode on the GPU with NVENC when ffmpeg and the machine support it"""
+    if shutil.which("nvidia-smi") is not None and shutil.which("ffmpeg") is not None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=PROBE_TIMEOUT
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            pass
+        else:
+            if result.returncode == 0 and "h264_nvenc" in result.stdout:
+                return ("-c:v", "h264_nvenc", "-preset", "p1")
+    return ("-c:v", "libx264", "-preset", "veryfast")
+
+def split_frame_range(start: int, end: int, parts: int) -> List[Tuple[int, int]]:
+    """Split [start, end] into at most parts contiguous, near-equal ranges"""
+    total = end - start + 1
+    parts = max(1, min(parts, total))
+    bounds = [start + total * i // parts for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
+
+# One keep-alive connection pool per event loop, shared by every agent and
+# the embedding calls of the LLM cache
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
 
 # --- App Configuration ---
 st.set_page_config(
@@ -28,10 +197,82 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+class _SessionLoop:
+    """Event loop of one Streamlit session, released once the session is gone"""
+    
+    def __init__(self, platform: "VideoEduPlatform"):
+        self.loop = asyncio.new_event_loop()
+        # Streamlit drops the session state of a closed session; close the
+        # loop and its pooled client then rather than at interpreter exit
+        finalizer = weakref.finalize(self, platform.release_loop, self.loop)
+        finalizer.atexit = False
+
 class VideoEduPlatform:
     def __init__(self):
+        # Pooled clients are kept per event loop and looked up by each agent
+        # call and cache embedding; each session runs its own loop, so the
+        # map is shared by every session thread
+        self._clients_lock = threading.Lock()
+        self._clients: Dict[int, Tuple[asyncio.AbstractEventLoop, AsyncOpenAI]] = {}
+        self.llm_cache = LLMCache(client=self.openai_client)
         self.setup_agents()
         self.setup_blender()
+        atexit.register(self.close_clients)
+    
+    def openai_client(self) -> AsyncOpenAI:
+        """Return the pooled OpenAI client of the running event loop"""
+        
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            entry = self._clients.get(id(loop))
+            if entry is None or entry[0] is not loop:
+                # Forget clients of loops that have since been closed
+                self._clients = {
+                    key: value for key, value in self._clients.items() if not value[0].is_closed()
+                }
+                http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+                entry = (loop, AsyncOpenAI(http_client=http_client))
+                self._clients[id(loop)] = entry
+        return entry[1]
+    
+    def run(self, coro):
+        """Run a pipeline coroutine to completion on the session's event loop.
+        
+        The agents are shared by every session, so they are never pointed at
+        a loop's client; each agent call passes the client of its own loop.
+        """
+        
+        # Each Streamlit session keeps one loop across its reruns, so pooled
+        # connections outlive a single run while sessions still render side by side
+        session_loop = st.session_state.get("event_loop")
+        if session_loop is None:
+            session_loop = _SessionLoop(self)
+            st.session_state["event_loop"] = session_loop
+        return session_loop.loop.run_until_complete(coro)
+    
+    def release_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a finished session's loop and its pooled client"""
+        
+        with self._clients_lock:
+            entry = self._clients.pop(id(loop), None)
+        
+        def close():
+            if entry is not None:
+                loop.run_until_complete(entry[1].close())
+            loop.close()
+        
+        # The session may be collected on a thread that is running its own loop
+        threading.Thread(target=close, daemon=True).start()
+    
+    def close_clients(self) -> None:
+        """Close the pooled clients and their session loops at interpreter exit"""
+        
+        with self._clients_lock:
+            for loop, client in self._clients.values():
+                if not loop.is_closed() and not loop.is_running():
+                    loop.run_until_complete(client.close())
+                    loop.close()
+            self._clients.clear()
     
     def setup_agents(self):
         """Initialize AI agents for different tasks"""
@@ -39,7 +280,7 @@ class VideoEduPlatform:
         # Content Analyzer Agent
         self.content_analyzer = Agent(
             name="Content Analyzer",
-            model="gpt-4",
+            model=ANALYZER_MODEL,
             instructions="""
             You are an expert educational content analyzer. Your job is to:
             1. Break down any educational topic into key visual concepts
@@ -49,13 +290,14 @@ class VideoEduPlatform:
             
             Always think in terms of 3D visualization and educational effectiveness.
             """,
+            response_format={"type": "json_object"},
             tools=[]
         )
         
         # 3D Scene Designer Agent
         self.scene_designer = Agent(
             name="3D Scene Designer",
-            model="gpt-4",
+            model=SCENE_DESIGNER_MODEL,
             instructions="""
             You are a 3D scene design expert. Your job is to:
             1. Convert educational concepts into Blender Python API code
@@ -68,10 +310,26 @@ class VideoEduPlatform:
             tools=[]
         )
         
+        # Template Filler Agent
+        self.template_filler = Agent(
+            name="Scene Template Filler",
+            model=SCENE_DESIGNER_MODEL,
+            instructions="""
+            You are a 3D scene data expert. Your job is to:
+            1. Fill in the data arguments of a prewritten Blender scene template
+            2. Place objects so they are clearly visible from the template camera
+            3. Keep keyframes inside the scene frame range (1-300)
+            
+            Respond with a single JSON object matching the requested schema.
+            """,
+            response_format={"type": "json_object"},
+            tools=[]
+        )
+        
         # Video Generator Agent
         self.video_generator = Agent(
             name="Video Generator",
-            model="gpt-4",
+            model=VIDEO_GENERATOR_MODEL,
             instructions="""
             You are a video production expert. Your job is to:
             1. Take 3D rendered frames and create compelling educational videos
@@ -87,43 +345,88 @@ class VideoEduPlatform:
     def setup_blender(self):
         """Initialize Blender for 3D scene creation"""
         try:
-            # This would be set up in a separate process or container
+            # Start one warm Blender per GPU now so videos skip its cold start
+            self.render_pool = BlenderWorkerPool(count_render_devices())
+            atexit.register(self.render_pool.close)
             self.blender_available = True
         except:
             self.blender_available = False
             st.warning("Blender not available. Using mock 3D generation.")
     
-    async def analyze_topic(self, topic: str, subject: str, level: str) -> Dict:
-        """Analyze educational topic and create 3D visualization plan"""
+    def build_analysis_prompt(self, topic: str, subject: str, level: str) -> str:
+        """Build the content analyzer prompt for a topic"""
         
-        prompt = f"""
+        return f"""
         Analyze this educational topic for 3D video creation:
         
         Topic: {topic}
         Subject: {subject}
         Level: {level}
         
-        Provide a detailed analysis including:
-        1. Key concepts to visualize
-        2. 3D objects and scenes needed
-        3. Animation sequences required
-        4. Camera movements and angles
-        5. Educational annotations and labels
-        6. Estimated video duration
-        
-        Return as structured JSON.
+        Provide a detailed analysis as a JSON object with these keys, in this order:
+        1. "key_concepts": key concepts to visualize
+        2. "objects": 3D objects and scenes needed
+        3. "animations": animation sequences required
+        4. "camera_movements": camera movements and angles
+        5. "annotations": educational annotations and labels
+        6. "duration": estimated video duration in seconds
         """
+    
+    async def stream_analysis(
+        self, topic: str, subject: str, level: str
+    ) -> AsyncIterator[Tuple[str, object]]:
+        """Yield top-level analysis fields as soon as each one is fully decoded"""
+        
+        cache = self.llm_cache
+        key = cache.make_key(ANALYSIS_CACHE_NAMESPACE, *analysis_cache_key(topic, subject, level))
+        scope, text = analysis_semantic_key(topic, subject, level)
+        scope = f"{ANALYSIS_CACHE_NAMESPACE}:{scope}"
+        
+        cached, vector = await cache.lookup(key, scope, text)
+        if cached is not None:
+            for field in cached.items():
+                yield field
+            return
+        
+        fields = ijson.sendable_list()
+        parser = ijson.kvitems_coro(fields, "", use_float=True)
+        analysis = {}
         
-        analysis = await self.content_analyzer.arun(prompt)
-        return json.loads(analysis)
+        stream = await self.content_analyzer.arun(
+            self.build_analysis_prompt(topic, subject, level),
+            stream=True,
+            max_tokens=ANALYZER_MAX_TOKENS,
+            client=self.openai_client()
+        )
+        async for chunk in stream:
+            if not chunk.content:
+                continue
+            parser.send(chunk.content.encode())
+            for field, value in fields:
+                analysis[field] = value
+                yield field, value
+            del fields[:]
+        
+        parser.close()
+        for field, value in fields:
+            analysis[field] = value
+            yield field, value
+        
+        cache.save(key, analysis, scope, vector)
     
-    async def create_3d_scene(self, analysis: Dict) -> str:
-        """Generate Blender Python script for 3D scene"""
+    async def analyze_topic(self, topic: str, subject: str, level: str) -> Dict:
+        """Analyze educational topic and create 3D visualization plan"""
+        
+        return {field: value async for field, value in self.stream_analysis(topic, subject, level)}
+    
+    def build_scene_prompt(self, analysis: Dict, quality: str) -> str:
+        """Build the scene designer prompt for an analysis"""
         
-        prompt = f"""
+        width, height, color_depth, _, _ = QUALITY_PRESETS[quality]
+        return f"""
         Create a Blender Python script based on this analysis:
         
-        {json.dumps(analysis, indent=2)}
+        {compact_json(analysis)}
         
         The script should:
         1. Set up the 3D scene with appropriate lighting
@@ -132,65 +435,219 @@ class VideoEduPlatform:
         4. Set up camera movements
         5. Create smooth animations
         6. Render frames for video production
+        7. Read "<output_dir> [<frame_start> <frame_end>]" from the arguments after
+           "--" in sys.argv, override the scene frame range when given, and render
+           the animation at {width}x{height} as {color_depth}-bit PNG frames to
+           <output_dir>/frames/frame_######
         
         Return only the complete Python script that can be executed in Blender.
         """
+    
+    def build_template_prompt(self, analysis: Dict, topic: str, subject: str) -> str:
+        """Build the prompt asking for a template's data arguments only"""
         
-        script = await self.scene_designer.arun(prompt)
+        _, fields = TEMPLATE_MAP[subject]
+        schema = "\n".join(f'        "{name}": {shape}' for name, shape in fields.items())
+        return f"""
+        Fill in the Blender {subject.lower()} scene template for this topic:
+        
+        Topic: {topic}
+        Analysis:
+        {compact_json(analysis)}
+        
+        Return a JSON object with exactly these keys:
+{schema}
+        """
+    
+    @cached_llm_call(TEMPLATE_CACHE_NAMESPACE, template_cache_key)
+    async def fill_template(self, analysis: Dict, topic: str, subject: str) -> Dict:
+        """Ask the LLM for the data arguments of a subject's template"""
+        
+        _, fields = TEMPLATE_MAP[subject]
+        data = json.loads(await self.template_filler.arun(
+            self.build_template_prompt(analysis, topic, subject),
+            client=self.openai_client()
+        ))
+        return {name: data.get(name, []) for name in fields}
+    
+    @cached_llm_call(SCENE_CACHE_NAMESPACE, scene_cache_key)
+    async def design_scene(self, analysis: Dict, quality: str) -> str:
+        """Have the LLM author a complete Blender script for 3D scene"""
+        
+        script = await self.scene_designer.arun(
+            self.build_scene_prompt(analysis, quality),
+            max_tokens=SCENE_DESIGNER_MAX_TOKENS,
+            client=self.openai_client()
+        )
         return script
     
-    async def generate_video(self, topic: str, script: str) -> str:
-        """Generate final educational video"""
+    async def create_3d_scene(
+        self, analysis: Dict, topic: str, subject: str, quality: str = "1080p"
+    ) -> str:
+        """Generate Blender Python script for 3D scene"""
+        
+        if subject in TEMPLATE_MAP:
+            builder, _ = TEMPLATE_MAP[subject]
+            data = await self.fill_template(analysis, topic, subject)
+            return builder(topic, **data, quality=quality)
+        return await self.design_scene(analysis, quality)
+    
+    async def generate_video(self, topic: str, script: str) -> Tuple[Optional[str], Optional[int]]:
+        """Generate final educational video and return its path and frame count"""
         
         if not self.blender_available:
             # Mock video generation for demo
-            return self.create_mock_video(topic)
+            return self.create_mock_video(topic), None
         
         # Execute Blender script and generate video
-        video_path = await self.execute_blender_script(script, topic)
-        return video_path
+        return await self.execute_blender_script(script, topic)
+    
+    async def render_scene(
+        self, analysis: Dict, topic: str, subject: str, quality: str
+    ) -> Tuple[str, Optional[str], Optional[int]]:
+        """Design the scene for an analysis and render it"""
+        
+        script = await self.create_3d_scene(analysis, topic, subject, quality)
+        video_path, frames = await self.generate_video(topic, script)
+        return script, video_path, frames
+    
+    async def pipeline(self, settings: Dict) -> Dict:
+        """Run analysis, scene design and rendering for one topic"""
+        
+        topic, subject = settings["topic"], settings["subject"]
+        analysis = {}
+        scene = None
+        
+        def start_scene():
+            scene_analysis = {name: analysis[name] for name in SCENE_FIELDS if name in analysis}
+            return asyncio.create_task(
+                self.render_scene(scene_analysis, topic, subject, settings["quality"])
+            )
+        
+        try:
+            async for field, value in self.stream_analysis(topic, subject, settings["level"]):
+                analysis[field] = value
+                # Start scene design as soon as the fields it needs are complete
+                if scene is None and all(name in analysis for name in SCENE_FIELDS):
+                    scene = start_scene()
+        except BaseException:
+            if scene is not None:
+                scene.cancel()
+            raise
+        
+        if scene is None:
+            scene = start_scene()
+        script, video_path, frames = await scene
+        
+        return {
+            "topic": topic,
+            "analysis": analysis,
+            "script": script,
+            "video_path": video_path,
+            "frames": frames
+        }
+    
+    async def generate_batch(self, topics: List[str], settings: Dict) -> List[Dict]:
+        """Generate videos for several topics concurrently"""
+        return await asyncio.gather(
+            *[self.pipeline({**settings, "topic": topic}) for topic in topics]
+        )
     
     def create_mock_video(self, topic: str) -> str:
         """Create a mock video for demonstration"""
         # This would create a placeholder video
         return f"mock_video_{topic.replace(' ', '_')}.mp4"
     
-    async def execute_blender_script(self, script: str, topic: str) -> str:
-        """Execute Blender script and generate video"""
-        
-        # Save script to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            script_path = f.name
+    def plan_render_shards(self) -> List[Tuple[int, int]]:
+        """Assign each render worker a slice of the frames"""
+        return split_frame_range(FRAME_START, FRAME_END, len(self.render_pool))
+    
+    async def encode_frames(self, output_dir: str) -> bool:
+        """Encode the rendered PNG frames into the final H.264 video"""
         
         try:
-            # Execute Blender script
-            output_dir = f"output/{topic.replace(' ', '_')}"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            cmd = [
-                "blender",
-                "--background",
-                "--python", script_path,
-                "--", output_dir
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return f"{output_dir}/final_video.mp4"
-            else:
-                st.error(f"Blender execution failed: {result.stderr}")
-                return None
-                
-        finally:
-            os.unlink(script_path)
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y",
+                "-framerate", str(VIDEO_FPS),
+                "-start_number", str(FRAME_START),
+                "-i", f"{output_dir}/frames/frame_%06d.png",
+                "-frames:v", str(FRAME_END - FRAME_START + 1),
+                *video_encoder(),
+                "-pix_fmt", "yuv420p",
+                f"{output_dir}/final_video.mp4",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            st.error(f"Video encoding failed: {e}")
+            return False
+        _, stderr = await proc.communicate()
+        
+        if proc.returncode != 0:
+            st.error(f"Video encoding failed: {stderr.decode(errors='replace')}")
+            return False
+        return True
+    
+    def render_progress(self):
+        """Show a progress bar and return a callback that counts one rendered frame"""
+        
+        bar = st.progress(0.0, text="Rendering frames...")
+        total = FRAME_END - FRAME_START + 1
+        done = 0
+        
+        def on_frame():
+            nonlocal done
+            done += 1
+            bar.progress(min(done / total, 1.0), text=f"Rendered {done}/{total} frames")
+        
+        return on_frame
+    
+    async def execute_blender_script(
+        self, script: str, topic: str
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """Execute Blender script on the warm workers and generate video"""
+        
+        module = cache_script(script)
+        
+        # Execute Blender script, starting from an empty frames directory so
+        # frames of an earlier, longer render never end up in the video
+        output_dir = f"output/{topic.replace(' ', '_')}"
+        shutil.rmtree(f"{output_dir}/frames", ignore_errors=True)
+        os.makedirs(f"{output_dir}/frames", exist_ok=True)
+        
+        # Render each slice of the frame range on its own GPU in parallel; the
+        # workers all write into the same frames directory
+        workers = self.render_pool.workers
+        on_frame = self.render_progress()
+        frames = await asyncio.gather(*[
+            worker.run(
+                str(SCRIPT_CACHE_DIR.resolve()),
+                module,
+                [os.path.abspath(output_dir), str(start), str(end)],
+                on_frame
+            )
+            for worker, (start, end) in zip(workers, self.plan_render_shards())
+        ])
+        
+        for worker, shard_frames in zip(workers, frames):
+            if shard_frames is None:
+                st.error(f"Blender execution failed: {worker.stderr_tail}")
+                return None, None
+        
+        if not await self.encode_frames(output_dir):
+            return None, None
+        return f"{output_dir}/final_video.mp4", sum(frames)
 
 # Initialize platform
 @st.cache_resource
 def get_platform():
     return VideoEduPlatform()
 
+@st.cache_data(show_spinner=False)
+def load_video_bytes(path: str, mtime: float) -> bytes:
+    """Read a rendered video once per file version instead of on every rerun"""
+    return Path(path).read_bytes()
+
 # --- UI Components ---
 def render_sidebar():
     st.sidebar.title("🎬 3D Video Edu Settings")
@@ -254,44 +711,39 @@ def render_main_content(settings):
             with st.spinner("Creating your 3D educational video..."):
                 platform = get_platform()
                 
-                # Step 1: Analyze topic
-                st.info("🔍 Analyzing topic and creating 3D visualization plan...")
-                analysis = asyncio.run(platform.analyze_topic(
-                    settings["topic"],
-                    settings["subject"],
-                    settings["level"]
-                ))
+                # Analyze, design and render in a single event loop
+                st.info("🔍 Analyzing topic, designing 3D scene and rendering video...")
+                result = platform.run(platform.pipeline(settings))
+                analysis = result["analysis"]
+                script = result["script"]
+                video_path = result["video_path"]
                 
                 # Display analysis
                 with st.expander("📋 3D Visualization Plan", expanded=True):
-                    st.json(analysis)
-                
-                # Step 2: Create 3D scene
-                st.info("🎨 Designing 3D scene and animations...")
-                script = asyncio.run(platform.create_3d_scene(analysis))
+                    st.code(json.dumps(analysis, indent=2), language="json")
                 
                 # Display script
                 with st.expander("🐍 Blender Script", expanded=False):
                     st.code(script, language="python")
                 
-                # Step 3: Generate video
-                st.info("🎬 Rendering 3D video...")
-                video_path = asyncio.run(platform.generate_video(settings["topic"], script))
-                
                 if video_path:
                     st.success("✅ 3D educational video generated successfully!")
+                    if result["frames"]:
+                        st.caption(f"Rendered {result['frames']} frames")
+                    
+                    # Player and download share one cached read of the file
+                    video_bytes = load_video_bytes(video_path, os.path.getmtime(video_path))
                     
                     # Display video
-                    st.video(video_path)
+                    st.video(video_bytes, format="video/mp4")
                     
                     # Download button
-                    with open(video_path, "rb") as file:
-                        st.download_button(
-                            label="📥 Download Video",
-                            data=file.read(),
-                            file_name=f"{settings['topic'].replace(' ', '_')}_3d_video.mp4",
-                            mime="video/mp4"
-                        )
+                    st.download_button(
+                        label="📥 Download Video",
+                        data=video_bytes,
+                        file_name=f"{settings['topic'].replace(' ', '_')}_3d_video.mp4",
+                        mime="video/mp4"
+                    )
                 else:
                     st.error("❌ Failed to generate video. Please try again.")
     
@@ -2,18 +2,249 @@
 Blender Python API templates for 3D educational video generation
 """
 
-def create_physics_scene(topic: str, objects: list, animations: list) -> str:
-    """Create a Blender scene for physics topics"""
-    
-    template = f'''
+# Emitted at the top of every scene script. Objects are built with bmesh and
+# linked directly instead of through bpy.ops, which re-evaluates the
+# dependency graph and pushes an undo step on every call.
+SCENE_PREAMBLE = '''
+import os
+import sys
 import bpy
 import bmesh
-from mathutils import Vector
+from mathutils import Matrix, Vector
 import math
+import numpy as np
+
+def clear_scene():
+    """Free every object and its data in one pass, without select/delete operators"""
+    bpy.data.batch_remove(ids=[
+        *bpy.data.objects, *bpy.data.meshes, *bpy.data.materials,
+        *bpy.data.cameras, *bpy.data.lights
+    ])
+
+def build_primitive(bm, kind, matrix, radius=1.0, size=1.0, depth=2.0):
+    """Add one primitive to a bmesh"""
+    if kind == 'sphere':
+        bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=radius, matrix=matrix)
+    elif kind == 'cube':
+        bmesh.ops.create_cube(bm, size=size, matrix=matrix)
+    elif kind == 'cylinder':
+        bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=radius, radius2=radius, depth=depth, matrix=matrix)
+    elif kind == 'plane':
+        bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size / 2, matrix=matrix)
+
+def link_mesh_object(name, bm):
+    """Write a bmesh into a new mesh object linked to the scene"""
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+def add_primitive(name, kind, location, **dims):
+    """Create a single primitive object at location"""
+    # Non-uniform cube sizes become a unit cube scaled on the object
+    scale = dims.get('size')
+    if isinstance(scale, (tuple, list)):
+        dims['size'] = 1.0
+    bm = bmesh.new()
+    build_primitive(bm, kind, Matrix.Identity(4), **dims)
+    obj = link_mesh_object(name, bm)
+    obj.location = location
+    if isinstance(scale, (tuple, list)):
+        obj.scale = scale
+    return obj
+
+def parent_objects(parent, children):
+    """Parent objects while keeping their world placement.
+    
+    Moving a group through its parent only changes one object transform, so
+    with persistent data Cycles keeps the children's geometry BVHs.
+    """
+    inverse = parent.matrix_basis.inverted()
+    for child in children:
+        child.parent = parent
+        child.matrix_parent_inverse = inverse
+
+def add_empty(name, location=(0, 0, 0)):
+    """Create an empty object to group other objects under"""
+    obj = bpy.data.objects.new(name, None)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+# Materials are shared per (name, color) so repeated elements reuse one datablock
+materials = {}
+
+def get_material(name, color, alpha=None):
+    """Return the shared Principled material for a name and color"""
+    key = (name, tuple(color))
+    mat = materials.get(key)
+    if mat is None:
+        mat = bpy.data.materials.new(name=name)
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes["Principled BSDF"]
+        bsdf.inputs["Base Color"].default_value = color
+        if alpha is not None:
+            bsdf.inputs["Alpha"].default_value = alpha
+        materials[key] = mat
+    return mat
+
+def add_cylinder_field(name, centers, radius=1.0, depth=2.0, segments=32):
+    """Create many identical capped cylinders as one mesh from numpy buffers"""
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+    
+    # One cylinder: a bottom and a top ring of vertices
+    angles = np.linspace(0, 2 * math.pi, segments, endpoint=False)
+    ring = np.stack([np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(segments)], axis=1)
+    unit = np.concatenate([ring - (0, 0, depth / 2), ring + (0, 0, depth / 2)]).astype(np.float32)
+    co = (unit[None, :, :] + centers[:, None, :]).ravel()
+    
+    # Side quads plus two caps per cylinder, offset by each cylinder's vertices
+    s = np.arange(segments)
+    loops = np.concatenate([
+        np.stack([s, (s + 1) % segments, (s + 1) % segments + segments, s + segments], axis=1).ravel(),
+        s[::-1],
+        s + segments
+    ])
+    loops = (loops[None, :] + (np.arange(len(centers)) * 2 * segments)[:, None]).ravel().astype(np.int32)
+    sizes = np.tile(np.array([4] * segments + [segments, segments], dtype=np.int32), len(centers))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32)
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set('co', co)
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set('vertex_index', loops)
+    mesh.polygons.add(len(sizes))
+    mesh.polygons.foreach_set('loop_start', starts)
+    if bpy.app.version < (4, 0, 0):
+        # Derived from loop_start and read-only since Blender 4.0
+        mesh.polygons.foreach_set('loop_total', sizes)
+    mesh.update(calc_edges=True)
+    
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
 
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+def enable_gpu_rendering(scene):
+    """Render Cycles on every available GPU, preferring OptiX over CUDA.
+    
+    Returns the enabled device type, or None when rendering stays on the CPU.
+    """
+    prefs = bpy.context.preferences.addons['cycles'].preferences
+    for device_type in ('OPTIX', 'CUDA'):
+        if any(d.type == device_type for d in prefs.get_devices_for_type(device_type)):
+            prefs.compute_device_type = device_type
+            for device in prefs.devices:
+                device.use = device.type == device_type
+            scene.cycles.device = 'GPU'
+            return device_type
+    return None
+
+# Keyframed data paths and the step transform entry each one reads from
+LOCATION_ROTATION = {'location': 'location', 'rotation_euler': 'rotation'}
+FULL_TRANSFORM = {'location': 'location', 'rotation_euler': 'rotation', 'scale': 'scale'}
+
+def bake_keyframes(steps, channels):
+    """Write step transforms as keyframes with one bulk copy per fcurve"""
+    # Group values per object and data path; a later step on the same frame
+    # wins, as it would with keyframe_insert
+    tracks = {}
+    for step in steps:
+        for obj_name, transform in step['transforms'].items():
+            track = tracks.setdefault(obj_name, {path: {} for path in channels})
+            for path, key in channels.items():
+                track[path][step['frame']] = transform[key]
+    
+    for obj_name, track in tracks.items():
+        obj = bpy.data.objects.get(obj_name)
+        if obj is None:
+            continue
+        anim = obj.animation_data or obj.animation_data_create()
+        if anim.action is None:
+            anim.action = bpy.data.actions.new(name=f"{obj_name}_action")
+        fcurves = anim.action.fcurves
+        
+        for path, keys in track.items():
+            frames = np.array(list(keys.keys()), dtype=np.float32)
+            values = np.array(list(keys.values()), dtype=np.float32).reshape(len(keys), -1)
+            order = np.argsort(frames)
+            co = np.empty(2 * len(frames), dtype=np.float32)
+            co[0::2] = frames[order]
+            for index in range(values.shape[1]):
+                fcurve = fcurves.find(path, index=index) or fcurves.new(path, index=index)
+                fcurve.keyframe_points.add(len(frames))
+                co[1::2] = values[order, index]
+                fcurve.keyframe_points.foreach_set('co', co)
+                fcurve.update()
+'''
+
+# Output resolution, PNG bit depth, pixel filter and view transform per
+# quality setting. Previews render at low spatial and color precision with
+# the cheapest filter; only 4K uses 16-bit frames and the wider Gaussian.
+QUALITY_PRESETS = {
+    "720p": (1280, 720, '8', 'BOX', 'Standard'),
+    "1080p": (1920, 1080, '8', 'BLACKMAN_HARRIS', None),
+    "4K": (3840, 2160, '16', 'GAUSSIAN', None)
+}
+
+def render_setup(quality: str = "1080p") -> str:
+    """Emit the render settings and render call that end every scene script"""
+    
+    width, height, color_depth, pixel_filter, view_transform = QUALITY_PRESETS[quality]
+    view_setup = f"scene.view_settings.view_transform = '{view_transform}'\n" if view_transform else ""
+    
+    return f'''
+# Set up rendering
+scene.render.engine = 'CYCLES'
+gpu_type = enable_gpu_rendering(scene)
+
+# Simple educational scenes converge quickly; stop sampling converged pixels
+# early and let the denoiser clean up the rest
+scene.cycles.samples = 64
+scene.cycles.use_adaptive_sampling = True
+scene.cycles.adaptive_threshold = 0.05
+scene.cycles.use_denoising = True
+scene.cycles.denoiser = 'OPTIX' if gpu_type == 'OPTIX' else 'OPENIMAGEDENOISE'
+
+# Keep BVH and compiled shaders between animation frames, and skip spatial
+# splits so the BVH that is rebuilt builds faster
+scene.render.use_persistent_data = True
+scene.cycles.debug_use_spatial_splits = False
+
+scene.render.resolution_x = {width}
+scene.render.resolution_y = {height}
+scene.render.resolution_percentage = 100
+scene.render.fps = 30
+scene.cycles.pixel_filter_type = '{pixel_filter}'
+{view_setup}
+# Write PNG frames at the preset's bit depth; the app encodes them into the final video in one
+# ffmpeg pass, and render workers can share a frame range without stitching
+scene.render.image_settings.file_format = 'PNG'
+scene.render.image_settings.color_mode = 'RGB'
+scene.render.image_settings.color_depth = '{color_depth}'
+
+# The app passes "-- <output_dir> [<frame_start> <frame_end>]" so each render
+# worker only renders its own slice of the animation
+argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+output_dir = os.path.abspath(argv[0]) if argv else "/tmp/3d_edu_video"
+if len(argv) >= 3:
+    scene.frame_start, scene.frame_end = int(argv[1]), int(argv[2])
+
+# Six digit padding keeps frame names sortable past 9999 frames
+scene.render.filepath = os.path.join(output_dir, "frames", "frame_######")
+
+# Render animation
+bpy.ops.render.render(animation=True)
+'''
+
+def create_physics_scene(topic: str, objects: list, animations: list, quality: str = "1080p") -> str:
+    """Create a Blender scene for physics topics"""
+    
+    template = f'''{SCENE_PREAMBLE}
+# Clear existing objects and their data
+clear_scene()
 
 # Set up scene
 scene = bpy.context.scene
@@ -38,65 +269,32 @@ area_light.data.energy = 2
 area_light.data.size = 5
 
 # Create educational objects based on topic
-{topic}_objects = {objects}
+objects = {objects}
 
-for obj_data in {topic}_objects:
+for obj_data in objects:
     if obj_data['type'] == 'sphere':
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            location=obj_data['location'],
-            radius=obj_data['radius']
-        )
-        obj = bpy.context.object
-        obj.name = obj_data['name']
-        
-        # Add material
-        mat = bpy.data.materials.new(name=f"{{obj_data['name']}}_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = obj_data['color']
-        obj.data.materials.append(mat)
-        
+        obj = add_primitive(obj_data['name'], 'sphere', obj_data['location'], radius=obj_data['radius'])
     elif obj_data['type'] == 'cube':
-        bpy.ops.mesh.primitive_cube_add(
-            location=obj_data['location'],
-            size=obj_data['size']
-        )
-        obj = bpy.context.object
-        obj.name = obj_data['name']
-        
-        # Add material
-        mat = bpy.data.materials.new(name=f"{{obj_data['name']}}_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = obj_data['color']
-        obj.data.materials.append(mat)
+        obj = add_primitive(obj_data['name'], 'cube', obj_data['location'], size=obj_data['size'])
+    else:
+        continue
+    
+    # Add material
+    obj.data.materials.append(get_material(f"{{obj_data['name']}}_material", obj_data['color']))
 
 # Add animations
 {animations}
 
-# Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
-
-# Render animation
-bpy.ops.render.render(animation=True)
-'''
+{render_setup(quality)}'''
     
     return template
 
-def create_chemistry_scene(topic: str, molecules: list, reactions: list) -> str:
+def create_chemistry_scene(topic: str, molecules: list, reactions: list, quality: str = "1080p") -> str:
     """Create a Blender scene for chemistry topics"""
     
-    template = f'''
-import bpy
-import bmesh
-from mathutils import Vector
-import math
-
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+    template = f'''{SCENE_PREAMBLE}
+# Clear existing objects and their data
+clear_scene()
 
 # Set up scene
 scene = bpy.context.scene
@@ -118,81 +316,57 @@ sun.data.energy = 2
 molecules = {molecules}
 
 for mol_data in molecules:
+    parts = []
+    
     # Create atom spheres
     for atom in mol_data['atoms']:
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            location=atom['position'],
+        atom_obj = add_primitive(
+            f"{{mol_data['name']}}_{{atom['element']}}",
+            'sphere',
+            atom['position'],
             radius=atom['radius']
         )
-        atom_obj = bpy.context.object
-        atom_obj.name = f"{{mol_data['name']}}_{{atom['element']}}"
         
-        # Add material based on element
-        mat = bpy.data.materials.new(name=f"{{atom['element']}}_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = atom['color']
-        atom_obj.data.materials.append(mat)
+        # Add material shared by every atom of this element
+        atom_obj.data.materials.append(get_material(f"{{atom['element']}}_material", atom['color']))
+        parts.append(atom_obj)
     
     # Create bonds
     for bond in mol_data['bonds']:
-        bpy.ops.mesh.primitive_cylinder_add(
-            location=bond['center'],
+        bond_obj = add_primitive(
+            f"{{mol_data['name']}}_bond_{{bond['id']}}",
+            'cylinder',
+            bond['center'],
             radius=0.1
         )
-        bond_obj = bpy.context.object
-        bond_obj.name = f"{{mol_data['name']}}_bond_{{bond['id']}}"
         
         # Scale and rotate bond
         bond_obj.scale = (1, 1, bond['length'] / 2)
         bond_obj.rotation_euler = bond['rotation']
         
         # Add bond material
-        mat = bpy.data.materials.new(name="bond_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-        bond_obj.data.materials.append(mat)
+        bond_obj.data.materials.append(get_material("bond_material", (0.5, 0.5, 0.5, 1)))
+        parts.append(bond_obj)
+    
+    # Group the molecule under an empty so animating it moves static meshes
+    parent_objects(add_empty(mol_data['name']), parts)
 
 # Add reaction animations
 reactions = {reactions}
 
-for reaction in reactions:
-    # Animate molecular interactions
-    for step in reaction['steps']:
-        frame = step['frame']
-        
-        for obj_name, transform in step['transforms'].items():
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.location = transform['location']
-                obj.rotation_euler = transform['rotation']
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-
-# Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
+# Animate molecular interactions
+bake_keyframes([step for reaction in reactions for step in reaction['steps']], LOCATION_ROTATION)
 
-# Render animation
-bpy.ops.render.render(animation=True)
-'''
+{render_setup(quality)}'''
     
     return template
 
-def create_biology_scene(topic: str, structures: list, processes: list) -> str:
+def create_biology_scene(topic: str, structures: list, processes: list, quality: str = "1080p") -> str:
     """Create a Blender scene for biology topics"""
     
-    template = f'''
-import bpy
-import bmesh
-from mathutils import Vector
-import math
-
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+    template = f'''{SCENE_PREAMBLE}
+# Clear existing objects and their data
+clear_scene()
 
 # Set up scene
 scene = bpy.context.scene
@@ -216,106 +390,56 @@ structures = {structures}
 for struct_data in structures:
     if struct_data['type'] == 'cell':
         # Create cell membrane
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            location=struct_data['location'],
-            radius=struct_data['radius']
-        )
-        cell = bpy.context.object
-        cell.name = struct_data['name']
+        cell = add_primitive(struct_data['name'], 'sphere', struct_data['location'], radius=struct_data['radius'])
         
         # Add semi-transparent material
-        mat = bpy.data.materials.new(name="cell_membrane")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.9, 1.0, 0.3)
-        mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.3  # Alpha
-        cell.data.materials.append(mat)
+        cell.data.materials.append(get_material("cell_membrane", (0.8, 0.9, 1.0, 0.3), alpha=0.3))
         
-        # Create organelles
+        # Create organelles, grouped under a static empty so the cell's own
+        # animation leaves them where they are
+        organelles = []
         for organelle in struct_data['organelles']:
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                location=organelle['position'],
+            org = add_primitive(
+                f"{{struct_data['name']}}_{{organelle['name']}}",
+                'sphere',
+                organelle['position'],
                 radius=organelle['radius']
             )
-            org = bpy.context.object
-            org.name = f"{{struct_data['name']}}_{{organelle['name']}}"
             
             # Add organelle material
-            mat = bpy.data.materials.new(name=f"{{organelle['name']}}_material")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = organelle['color']
-            org.data.materials.append(mat)
+            org.data.materials.append(get_material(f"{{organelle['name']}}_material", organelle['color']))
+            organelles.append(org)
+        parent_objects(add_empty(f"{{struct_data['name']}}_organelles"), organelles)
     
     elif struct_data['type'] == 'dna':
-        # Create DNA double helix
-        for i in range(struct_data['length']):
-            # Create base pairs
-            bpy.ops.mesh.primitive_cylinder_add(
-                location=(math.cos(i * 0.5) * 0.5, i * 0.2, 0),
-                radius=0.1
-            )
-            base1 = bpy.context.object
-            base1.name = f"dna_base1_{{i}}"
-            
-            bpy.ops.mesh.primitive_cylinder_add(
-                location=(math.cos(i * 0.5 + math.pi) * 0.5, i * 0.2, 0),
-                radius=0.1
-            )
-            base2 = bpy.context.object
-            base2.name = f"dna_base2_{{i}}"
-            
-            # Add materials
-            mat1 = bpy.data.materials.new(name="dna_base1")
-            mat1.use_nodes = True
-            mat1.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (1, 0.5, 0.5, 1)
-            base1.data.materials.append(mat1)
-            
-            mat2 = bpy.data.materials.new(name="dna_base2")
-            mat2.use_nodes = True
-            mat2.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 1, 1)
-            base2.data.materials.append(mat2)
+        # Create DNA double helix, one mesh per strand of base pairs, with all
+        # coordinates computed in a single vectorized pass
+        i = np.arange(struct_data['length'])
+        y = i * 0.2
+        strand1 = np.stack([np.cos(i * 0.5) * 0.5, y, np.zeros_like(y)], axis=1)
+        strand2 = np.stack([np.cos(i * 0.5 + np.pi) * 0.5, y, np.zeros_like(y)], axis=1)
+        base1 = add_cylinder_field("dna_base1", strand1, radius=0.1)
+        base2 = add_cylinder_field("dna_base2", strand2, radius=0.1)
+        
+        # Add materials
+        base1.data.materials.append(get_material("dna_base1", (1, 0.5, 0.5, 1)))
+        base2.data.materials.append(get_material("dna_base2", (0.5, 0.5, 1, 1)))
 
 # Add process animations
 processes = {processes}
 
-for process in processes:
-    for step in process['steps']:
-        frame = step['frame']
-        
-        for obj_name, transform in step['transforms'].items():
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.location = transform['location']
-                obj.rotation_euler = transform['rotation']
-                obj.scale = transform['scale']
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                obj.keyframe_insert(data_path="scale", frame=frame)
-
-# Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
+bake_keyframes([step for process in processes for step in process['steps']], FULL_TRANSFORM)
 
-# Render animation
-bpy.ops.render.render(animation=True)
-'''
+{render_setup(quality)}'''
     
     return template
 
-def create_mathematics_scene(topic: str, shapes: list, equations: list) -> str:
+def create_mathematics_scene(topic: str, shapes: list, equations: list, quality: str = "1080p") -> str:
     """Create a Blender scene for mathematics topics"""
     
-    template = f'''
-import bpy
-import bmesh
-from mathutils import Vector
-import math
-
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+    template = f'''{SCENE_PREAMBLE}
+# Clear existing objects and their data
+clear_scene()
 
 # Set up scene
 scene = bpy.context.scene
@@ -339,9 +463,7 @@ shapes = {shapes}
 for shape_data in shapes:
     if shape_data['type'] == 'function_surface':
         # Create function surface using geometry nodes
-        bpy.ops.mesh.primitive_plane_add(size=10)
-        plane = bpy.context.object
-        plane.name = shape_data['name']
+        plane = add_primitive(shape_data['name'], 'plane', (0, 0, 0), size=10)
         
         # Add geometry nodes modifier
         modifier = plane.modifiers.new(name="FunctionSurface", type='NODES')
@@ -365,73 +487,38 @@ for shape_data in shapes:
         
     elif shape_data['type'] == 'geometric_solid':
         if shape_data['shape'] == 'cube':
-            bpy.ops.mesh.primitive_cube_add(
-                location=shape_data['location'],
-                size=shape_data['size']
-            )
+            obj = add_primitive(shape_data['name'], 'cube', shape_data['location'], size=shape_data['size'])
         elif shape_data['shape'] == 'sphere':
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                location=shape_data['location'],
-                radius=shape_data['radius']
-            )
+            obj = add_primitive(shape_data['name'], 'sphere', shape_data['location'], radius=shape_data['radius'])
         elif shape_data['shape'] == 'cylinder':
-            bpy.ops.mesh.primitive_cylinder_add(
-                location=shape_data['location'],
+            obj = add_primitive(
+                shape_data['name'],
+                'cylinder',
+                shape_data['location'],
                 radius=shape_data['radius'],
                 depth=shape_data['height']
             )
-        
-        obj = bpy.context.object
-        obj.name = shape_data['name']
+        else:
+            continue
         
         # Add material
-        mat = bpy.data.materials.new(name=f"{{shape_data['name']}}_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = shape_data['color']
-        obj.data.materials.append(mat)
+        obj.data.materials.append(get_material(f"{{shape_data['name']}}_material", shape_data['color']))
 
 # Add equation animations
 equations = {equations}
 
-for equation in equations:
-    for step in equation['steps']:
-        frame = step['frame']
-        
-        for obj_name, transform in step['transforms'].items():
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.location = transform['location']
-                obj.rotation_euler = transform['rotation']
-                obj.scale = transform['scale']
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                obj.keyframe_insert(data_path="scale", frame=frame)
-
-# Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
+bake_keyframes([step for equation in equations for step in equation['steps']], FULL_TRANSFORM)
 
-# Render animation
-bpy.ops.render.render(animation=True)
-'''
+{render_setup(quality)}'''
     
     return template
 
-def create_history_scene(topic: str, structures: list, timeline: list) -> str:
+def create_history_scene(topic: str, structures: list, timeline: list, quality: str = "1080p") -> str:
     """Create a Blender scene for history topics"""
     
-    template = f'''
-import bpy
-import bmesh
-from mathutils import Vector
-import math
-
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+    template = f'''{SCENE_PREAMBLE}
+# Clear existing objects and their data
+clear_scene()
 
 # Set up scene
 scene = bpy.context.scene
@@ -455,70 +542,38 @@ structures = {structures}
 for struct_data in structures:
     if struct_data['type'] == 'building':
         # Create building base
-        bpy.ops.mesh.primitive_cube_add(
-            location=struct_data['location'],
-            size=struct_data['size']
-        )
-        building = bpy.context.object
-        building.name = struct_data['name']
+        building = add_primitive(struct_data['name'], 'cube', struct_data['location'], size=struct_data['size'])
         
         # Add architectural details
         for detail in struct_data['details']:
-            bpy.ops.mesh.primitive_cube_add(
-                location=detail['position'],
+            detail_obj = add_primitive(
+                f"{{struct_data['name']}}_{{detail['name']}}",
+                'cube',
+                detail['position'],
                 size=detail['size']
             )
-            detail_obj = bpy.context.object
-            detail_obj.name = f"{{struct_data['name']}}_{{detail['name']}}"
             
             # Add material
-            mat = bpy.data.materials.new(name=f"{{detail['name']}}_material")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = detail['color']
-            detail_obj.data.materials.append(mat)
+            detail_obj.data.materials.append(get_material(f"{{detail['name']}}_material", detail['color']))
     
     elif struct_data['type'] == 'monument':
         # Create monument
-        bpy.ops.mesh.primitive_cylinder_add(
-            location=struct_data['location'],
+        monument = add_primitive(
+            struct_data['name'],
+            'cylinder',
+            struct_data['location'],
             radius=struct_data['radius'],
             depth=struct_data['height']
         )
-        monument = bpy.context.object
-        monument.name = struct_data['name']
         
         # Add material
-        mat = bpy.data.materials.new(name="monument_material")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.7, 0.6, 1)
-        monument.data.materials.append(mat)
+        monument.data.materials.append(get_material("monument_material", (0.8, 0.7, 0.6, 1)))
 
 # Add timeline animations
 timeline = {timeline}
 
-for event in timeline:
-    for step in event['steps']:
-        frame = step['frame']
-        
-        for obj_name, transform in step['transforms'].items():
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.location = transform['location']
-                obj.rotation_euler = transform['rotation']
-                obj.scale = transform['scale']
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                obj.keyframe_insert(data_path="scale", frame=frame)
-
-# Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
+bake_keyframes([step for event in timeline for step in event['steps']], FULL_TRANSFORM)
 
-# Render animation
-bpy.ops.render.render(animation=True)
-'''
+{render_setup(quality)}'''
     
     return template
@@ -0,0 +1,51 @@
+"""
+Keep-alive Blender worker for the 3D Video Educational AI Platform
+
+Started once as `blender --background --python blender_worker.py`, then runs
+one JSON job per stdin line so later videos skip Blender's cold start.
+"""
+
+import importlib
+import json
+import runpy
+import sys
+import traceback
+
+import bpy
+
+DONE_SENTINEL = "__EDU_RENDER_DONE__"
+FAILED_SENTINEL = "__EDU_RENDER_FAILED__"
+
+def run_job(job: dict) -> int:
+    """Run one cached scene script on a fresh startup scene and return its frame count"""
+
+    # Start every job from the same state a newly launched Blender would
+    bpy.ops.wm.read_homefile()
+
+    if job["path"] not in sys.path:
+        sys.path.insert(0, job["path"])
+
+    # Scene scripts read their output directory and frame range after "--"
+    sys.argv = [sys.argv[0], "--", *job["args"]]
+
+    # The module was written after this worker started; drop the import
+    # system's cached directory listings so it is found
+    importlib.invalidate_caches()
+    runpy.run_module(job["module"], run_name="__main__")
+
+    scene = bpy.context.scene
+    return scene.frame_end - scene.frame_start + 1
+
+def main():
+    for line in sys.stdin:
+        job = json.loads(line)
+        try:
+            frames = run_job(job)
+        except Exception:
+            traceback.print_exc()
+            sys.stderr.flush()
+            print(FAILED_SENTINEL, job["id"], flush=True)
+        else:
+            print(DONE_SENTINEL, job["id"], frames, flush=True)
+
+main()
@@ -1,17 +1,99 @@
 import streamlit as st
 import asyncio
-import json
-import base64
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import tempfile
 import os
 from datetime import datetime
 import subprocess
 import shutil
+import atexit
+import functools
+import hashlib
+import types
+import re
+import string
+import threading
+from collections import deque
+import orjson
 
-# Import Nano Banana integration
-from nano_banana_integration import integrate_with_main_app, NanoBananaVideoEduPlatform
+# LLM output caching
+from llm_cache import LLMCache, cached_llm_call
+
+# Cache entries live in their own namespaces, apart from the main app's
+ANALYSIS_CACHE_NAMESPACE = "enhanced-analysis"
+SCENE_CACHE_NAMESPACE = "enhanced-scene"
+
+def analysis_cache_key(topic: str, subject: str, level: str) -> tuple:
+    return (subject, level, topic.strip().lower())
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+def scene_cache_key(analysis: Dict, quality: str = "1080p") -> tuple:
+    return (quality, orjson.dumps(analysis, option=orjson.OPT_SORT_KEYS).decode())
+
+RESOLUTIONS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160)
+}
+
+# Blender render output is followed live; only its tail is kept for errors.
+# The frame range is split across several Blender processes rendering at once.
+RENDER_FRAMES = 300
+MAX_RENDER_SHARDS = 8
+BLENDER_TIMEOUT = 60 * 60
+BLENDER_OUTPUT_TAIL = 200
+FRAME_LINE = re.compile(rb"^Fra:(\d+)")
+
+# Renders are keyed by their script, which pins down analysis and quality
+RENDER_CACHE_DIR = Path("output", "cache")
+
+RENDER_INDEX = RENDER_CACHE_DIR / "index.json"
+
+def render_cache_path(script: str) -> str:
+    digest = hashlib.blake2b(script.encode()).hexdigest()
+    return str(RENDER_CACHE_DIR / digest / "final_video.mp4")
+
+def cached_render(video_path: str) -> bool:
+    """Whether a complete render already exists at video_path"""
+    try:
+        return os.stat(video_path).st_size > 0
+    except OSError:
+        return False
+
+# Sessions finishing renders at once take turns updating the index
+_render_index_lock = threading.Lock()
+
+def load_render_index() -> Dict[str, Dict]:
+    """Return the on-disk index of prior renders, keyed by script digest"""
+    try:
+        return orjson.loads(RENDER_INDEX.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def record_render(video_path: str, topic: str) -> None:
+    """Add a finished render to the on-disk index of prior renders"""
+    with _render_index_lock:
+        index = load_render_index()
+        index[Path(video_path).parent.name] = {
+            "topic": topic,
+            "path": video_path,
+            "rendered_at": datetime.now().isoformat(timespec="seconds")
+        }
+        
+        # Replace the index atomically so a reader never sees a partial file
+        with tempfile.NamedTemporaryFile(dir=RENDER_INDEX.parent, suffix=".partial", delete=False) as partial:
+            partial.write(orjson.dumps(index, option=orjson.OPT_INDENT_2))
+        os.replace(partial.name, RENDER_INDEX)
+
+def split_frame_range(start: int, end: int, parts: int) -> List[tuple]:
+    """Split [start, end] into at most parts contiguous, near-equal ranges"""
+    total = end - start + 1
+    parts = max(1, min(parts, total))
+    bounds = [start + total * i // parts for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
 
 # --- App Configuration ---
 st.set_page_config(
@@ -21,146 +103,106 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-class EnhancedVideoEduPlatform:
-    def __init__(self):
-        self.setup_agents()
-        self.setup_nano_banana()
-    
-    def setup_agents(self):
-        """Initialize AI agents for different tasks"""
-        
-        # Content Analyzer Agent
-        self.content_analyzer = {
-            "name": "Content Analyzer",
-            "instructions": """
-            You are an expert educational content analyzer. Your job is to:
-            1. Break down any educational topic into key visual concepts
-            2. Identify what 3D objects, animations, and scenes would best demonstrate the concept
-            3. Create a detailed storyboard with camera movements and object interactions
-            4. Suggest appropriate 3D models and materials needed
-            
-            Always think in terms of 3D visualization and educational effectiveness.
-            """,
-            "tools": []
-        }
-        
-        # 3D Scene Designer Agent
-        self.scene_designer = {
-            "name": "3D Scene Designer",
-            "instructions": """
-            You are a 3D scene design expert. Your job is to:
-            1. Convert educational concepts into Blender Python API code
-            2. Create 3D scenes with appropriate lighting, materials, and camera angles
-            3. Design smooth animations that demonstrate the concept clearly
-            4. Optimize scenes for educational video production
-            
-            Generate complete Blender Python scripts that can be executed directly.
-            """,
-            "tools": []
-        }
-        
-        # Video Generator Agent
-        self.video_generator = {
-            "name": "Video Generator",
-            "instructions": """
-            You are a video production expert. Your job is to:
-            1. Take 3D rendered frames and create compelling educational videos
-            2. Add appropriate transitions, text overlays, and educational annotations
-            3. Ensure videos are optimized for different platforms and devices
-            4. Create engaging thumbnails and previews
-            
-            Focus on educational effectiveness and visual appeal.
-            """,
-            "tools": []
-        }
+# Result of the Blender probe, kept for the life of the process
+_blender_probe: Dict[str, bool] = {}
+
+async def _probe_blender() -> bool:
+    """Check once per process whether a working Blender is on the PATH"""
+    if "available" not in _blender_probe:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'blender', '--version',
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            _blender_probe["available"] = False
+        else:
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=10)
+                _blender_probe["available"] = proc.returncode == 0
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                _blender_probe["available"] = False
+    return _blender_probe["available"]
+
+# Agent definitions are immutable and shared by every platform instance
+_CONTENT_ANALYZER = types.MappingProxyType({
+    "name": "Content Analyzer",
+    "instructions": """
+    You are an expert educational content analyzer. Your job is to:
+    1. Break down any educational topic into key visual concepts
+    2. Identify what 3D objects, animations, and scenes would best demonstrate the concept
+    3. Create a detailed storyboard with camera movements and object interactions
+    4. Suggest appropriate 3D models and materials needed
     
-    def setup_nano_banana(self):
-        """Setup Nano Banana integration"""
-        self.nano_banana_platform = NanoBananaVideoEduPlatform()
+    Always think in terms of 3D visualization and educational effectiveness.
+    """,
+    "tools": ()
+})
+
+_SCENE_DESIGNER = types.MappingProxyType({
+    "name": "3D Scene Designer",
+    "instructions": """
+    You are a 3D scene design expert. Your job is to:
+    1. Convert educational concepts into Blender Python API code
+    2. Create 3D scenes with appropriate lighting, materials, and camera angles
+    3. Design smooth animations that demonstrate the concept clearly
+    4. Optimize scenes for educational video production
     
-    async def analyze_topic(self, topic: str, subject: str, level: str) -> Dict:
-        """Analyze educational topic and create visualization plan"""
-        
-        prompt = f"""
-        Analyze this educational topic for 3D video creation:
-        
-        Topic: {topic}
-        Subject: {subject}
-        Level: {level}
-        
-        Provide a detailed analysis including:
-        1. Key concepts to visualize
-        2. 3D objects and scenes needed
-        3. Animation sequences required
-        4. Camera movements and angles
-        5. Educational annotations and labels
-        6. Estimated video duration
-        
-        Return as structured JSON.
-        """
-        
-        # For now, return a mock analysis
-        # In production, this would use OpenAI or another LLM
-        analysis = {
-            "topic": topic,
-            "subject": subject,
-            "level": level,
-            "concepts": [
-                {
-                    "name": "Main Concept",
-                    "description": f"Visual representation of {topic}",
-                    "3d_objects": ["Sphere", "Cube", "Cylinder"],
-                    "animations": ["Rotation", "Scale", "Movement"],
-                    "camera_angles": ["Front", "Side", "Top"],
-                    "annotations": ["Key terms", "Important relationships", "Process steps"]
-                }
-            ],
-            "workflow_steps": [
-                "Generate main concept visualization",
-                "Add educational annotations",
-                "Create animation frames",
-                "Combine into educational sequence"
-            ],
-            "animation_frames": 3,
-            "estimated_duration": 120
-        }
-        
-        return analysis
+    Generate complete Blender Python scripts that can be executed directly.
+    """,
+    "tools": ()
+})
+
+_VIDEO_GENERATOR = types.MappingProxyType({
+    "name": "Video Generator",
+    "instructions": """
+    You are a video production expert. Your job is to:
+    1. Take 3D rendered frames and create compelling educational videos
+    2. Add appropriate transitions, text overlays, and educational annotations
+    3. Ensure videos are optimized for different platforms and devices
+    4. Create engaging thumbnails and previews
     
-    async def create_3d_scene(self, analysis: Dict) -> str:
-        """Generate Blender Python script for 3D scene"""
-        
-        prompt = f"""
-        Create a Blender Python script based on this analysis:
-        
-        {json.dumps(analysis, indent=2)}
-        
-        The script should:
-        1. Set up the 3D scene with appropriate lighting
-        2. Create all necessary 3D objects
-        3. Add materials and textures
-        4. Set up camera movements
-        5. Create smooth animations
-        6. Render frames for video production
-        
-        Return only the complete Python script that can be executed in Blender.
-        """
-        
-        # For now, return a mock script
-        script = f"""
+    Focus on educational effectiveness and visual appeal.
+    """,
+    "tools": ()
+})
+
+# The mock scene script is parsed once; only its placeholders vary per call
+_CYCLES_SETUP = """scene.render.engine = 'CYCLES'
+scene.cycles.samples = 64
+scene.cycles.use_adaptive_sampling = True
+
+# Cycles renders on the CPU unless GPU devices are enabled; prefer OptiX
+prefs = bpy.context.preferences.addons['cycles'].preferences
+gpu_type = next((t for t in ('OPTIX', 'CUDA') if prefs.get_devices_for_type(t)), None)
+if gpu_type is not None:
+    prefs.compute_device_type = gpu_type
+    for device in prefs.devices:
+        device.use = device.type != 'CPU'
+    scene.cycles.device = 'GPU'
+    # Large tiles keep the GPU busy; Cycles X replaced tile_x/tile_y with this
+    scene.cycles.tile_size = 2048"""
+
+_EEVEE_SETUP = """# Eevee is BLENDER_EEVEE_NEXT from 4.2 until 5.0 renamed it back
+scene.render.engine = 'BLENDER_EEVEE_NEXT' if (4, 2, 0) <= bpy.app.version < (5, 0, 0) else 'BLENDER_EEVEE'
+scene.eevee.taa_render_samples = 16"""
+
+_BLENDER_TEMPLATE = string.Template("""
+import os
+import sys
 import bpy
-import bmesh
-from mathutils import Vector
 import math
+import numpy as np
 
 # Clear existing mesh objects
 bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete(use_global=False)
 
-# Set up scene
+# Set up scene; the frame range comes from Blender's -s/-e flags
 scene = bpy.context.scene
-scene.frame_start = 1
-scene.frame_end = 300
 
 # Set up camera
 bpy.ops.object.camera_add(location=(0, -10, 5))
@@ -173,7 +215,7 @@ bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
 sun = bpy.context.object
 sun.data.energy = 3
 
-# Create educational objects for: {analysis['topic']}
+# Create educational objects for: $topic
 # This would be customized based on the analysis
 bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=2)
 sphere = bpy.context.object
@@ -185,31 +227,171 @@ mat.use_nodes = True
 mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.0, 0.5, 1.0, 1.0)
 sphere.data.materials.append(mat)
 
+# Spin the concept once over the video. All keyframes are written in one
+# foreach_set call instead of one keyframe_insert per frame.
+action = bpy.data.actions.new(name="Main_Concept_Spin")
+sphere.animation_data_create().action = action
+if hasattr(action, "fcurve_ensure_for_datablock"):
+    fcurve = action.fcurve_ensure_for_datablock(sphere, "rotation_euler", index=2)
+else:
+    fcurve = action.fcurves.new("rotation_euler", index=2)
+
+frames = np.arange(1, $frames + 1, dtype=np.float32)
+angles = np.linspace(0, 2 * math.pi, $frames, dtype=np.float32)
+coords = np.empty(2 * len(frames), dtype=np.float32)
+coords[0::2] = frames
+coords[1::2] = angles
+fcurve.keyframe_points.add(len(frames))
+fcurve.keyframe_points.foreach_set("co", coords)
+fcurve.update()
+
 # Set up rendering
-scene.render.engine = 'CYCLES'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
+$engine_setup
+scene.render.resolution_x = $width
+scene.render.resolution_y = $height
 scene.render.fps = 30
-scene.render.filepath = "/tmp/3d_edu_video/"
 
-# Render animation
-bpy.ops.render.render(animation=True)
-"""
+# Encode straight to a video file in the output directory passed after "--";
+# Blender renders the animation itself once -a follows this script
+output_dir = sys.argv[sys.argv.index("--") + 1]
+scene.render.image_settings.file_format = 'FFMPEG'
+scene.render.ffmpeg.format = 'MPEG4'
+scene.render.ffmpeg.codec = 'H264'
+scene.render.filepath = os.path.join(os.path.abspath(output_dir), "final_video.mp4")
+""")
+
+# Streamlit keeps these results in memory across reruns and sessions; the
+# platform methods still consult the shared LLM cache on disk first
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_analyze(topic: str, subject: str, level: str) -> Dict:
+    """Build the visualization plan for a topic"""
+    prompt = f"""
+    Analyze this educational topic for 3D video creation:
+    
+    Topic: {topic}
+    Subject: {subject}
+    Level: {level}
+    
+    Provide a detailed analysis including:
+    1. Key concepts to visualize
+    2. 3D objects and scenes needed
+    3. Animation sequences required
+    4. Camera movements and angles
+    5. Educational annotations and labels
+    6. Estimated video duration
+    
+    Return as structured JSON.
+    """
+    
+    # For now, return a mock analysis
+    # In production, this would use OpenAI or another LLM
+    analysis = {
+        "topic": topic,
+        "subject": subject,
+        "level": level,
+        "concepts": [
+            {
+                "name": "Main Concept",
+                "description": f"Visual representation of {topic}",
+                "3d_objects": ["Sphere", "Cube", "Cylinder"],
+                "animations": ["Rotation", "Scale", "Movement"],
+                "camera_angles": ["Front", "Side", "Top"],
+                "annotations": ["Key terms", "Important relationships", "Process steps"]
+            }
+        ],
+        "workflow_steps": [
+            "Generate main concept visualization",
+            "Add educational annotations",
+            "Create animation frames",
+            "Combine into educational sequence"
+        ],
+        "animation_frames": 3,
+        "estimated_duration": 120,
+        # Only photoreal materials or lighting need Cycles path tracing
+        "requires_pathtracing": False
+    }
+    
+    return analysis
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_scene(analysis: Dict, quality: str) -> str:
+    """Build the Blender script for an analysis at the given quality"""
+    prompt = f"""
+    Create a Blender Python script based on this analysis:
+    
+    {_dumps(analysis)}
+    
+    The script should:
+    1. Set up the 3D scene with appropriate lighting
+    2. Create all necessary 3D objects
+    3. Add materials and textures
+    4. Set up camera movements
+    5. Create smooth animations
+    6. Render frames for video production
+    
+    Return only the complete Python script that can be executed in Blender.
+    """
+    
+    # Eevee rasterizes these simple scenes far faster than Cycles path
+    # traces them; escalate to Cycles only when the analysis asks for it
+    if analysis.get("requires_pathtracing", False):
+        engine_setup = _CYCLES_SETUP
+    else:
+        engine_setup = _EEVEE_SETUP
+    
+    width, height = RESOLUTIONS[quality]
+    
+    # For now, return a mock script
+    script = _BLENDER_TEMPLATE.substitute(
+        topic=analysis['topic'],
+        frames=RENDER_FRAMES,
+        engine_setup=engine_setup,
+        width=width,
+        height=height
+    )
+    
+    return script
+
+class EnhancedVideoEduPlatform:
+    def __init__(self):
+        self.llm_cache = LLMCache(directory="output/.llm_cache")
+        self.content_analyzer = _CONTENT_ANALYZER
+        self.scene_designer = _SCENE_DESIGNER
+        self.video_generator = _VIDEO_GENERATOR
         
-        return script
+        # Scripts are written once per process and kept until it exits
+        self._scratch = Path(tempfile.gettempdir()) / f"edu_platform_{os.getpid()}"
+        self._scratch.mkdir(exist_ok=True)
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+    
+    @functools.cached_property
+    def nano_banana_platform(self):
+        """Nano Banana platform, imported and built on first use only"""
+        from nano_banana_integration import NanoBananaVideoEduPlatform
+        return NanoBananaVideoEduPlatform()
+    
+    @cached_llm_call(ANALYSIS_CACHE_NAMESPACE, analysis_cache_key)
+    async def analyze_topic(self, topic: str, subject: str, level: str) -> Dict:
+        """Analyze educational topic and create visualization plan"""
+        
+        return _cached_analyze(topic, subject, level)
+    
+    @cached_llm_call(SCENE_CACHE_NAMESPACE, scene_cache_key)
+    async def create_3d_scene(self, analysis: Dict, quality: str = "1080p") -> str:
+        """Generate Blender Python script for 3D scene"""
+        
+        return _cached_scene(analysis, quality)
     
     async def generate_video(self, topic: str, script: str) -> str:
         """Generate final educational video"""
         
-        # Check if Blender is available
-        try:
-            result = subprocess.run(['blender', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            blender_available = result.returncode == 0
-        except:
-            blender_available = False
+        # An identical script was rendered before; skip Blender entirely
+        video_path = render_cache_path(script)
+        if cached_render(video_path):
+            return video_path
         
-        if not blender_available:
+        # Check if Blender is available
+        if not await _probe_blender():
             st.warning("⚠️ Blender not found. Using Nano Banana for visual generation...")
             return await self.nano_banana_platform.generate_educational_video(
                 topic, "Physics", "High School"
@@ -222,40 +404,158 @@ bpy.ops.render.render(animation=True)
     async def execute_blender_script(self, script: str, topic: str) -> str:
         """Execute Blender script and generate video"""
         
-        # Save script to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script)
-            script_path = f.name
+        # Re-running the same script reuses its file in the scratch directory
+        video_path = render_cache_path(script)
+        output_dir = Path(video_path).parent
+        script_path = self._scratch / f"script_{output_dir.name}.py"
+        if not script_path.exists():
+            script_path.write_text(script, encoding="utf-8")
+        
+        # Give each shard an equal share of the CPU threads
+        cpus = os.cpu_count() or 1
+        shards = split_frame_range(1, RENDER_FRAMES, min(max(1, cpus // 2), MAX_RENDER_SHARDS))
+        threads = max(1, cpus // len(shards))
+        shard_dirs = [output_dir / f"shard_{i}" for i in range(len(shards))]
         
+        procs = []
         try:
-            # Execute Blender script
-            output_dir = f"output/{topic.replace(' ', '_')}"
-            os.makedirs(output_dir, exist_ok=True)
+            for shard_dir, (start, end) in zip(shard_dirs, shards):
+                shard_dir.mkdir(parents=True, exist_ok=True)
+                procs.append(await asyncio.create_subprocess_exec(
+                    "blender",
+                    "--background",
+                    "--python", str(script_path),
+                    "--threads", str(threads),
+                    "-s", str(start),
+                    "-e", str(end),
+                    "-a",
+                    "--", str(shard_dir),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT
+                ))
             
-            cmd = [
-                "blender",
-                "--background",
-                "--python", script_path,
-                "--", output_dir
-            ]
+            status = st.status("Rendering with Blender...", expanded=False)
+            progress_bar = st.progress(0.0)
+            tails = [deque(maxlen=BLENDER_OUTPUT_TAIL) for _ in procs]
+            rendered = [0] * len(procs)
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            async def follow_output(i, proc):
+                start = shards[i][0]
+                # Lines stay bytes; only the tail is decoded, and only on failure
+                async for line in proc.stdout:
+                    tails[i].append(line)
+                    match = FRAME_LINE.match(line)
+                    if match:
+                        rendered[i] = max(rendered[i], int(match.group(1)) - start + 1)
+                        done = sum(rendered)
+                        status.update(label=f"Rendering frame {done}/{RENDER_FRAMES}")
+                        progress_bar.progress(min(done / RENDER_FRAMES, 1.0))
+                await proc.wait()
             
-            if result.returncode == 0:
-                return f"{output_dir}/final_video.mp4"
-            else:
-                st.error(f"Blender execution failed: {result.stderr}")
-                return None
-                
+            await asyncio.wait_for(
+                asyncio.gather(*[follow_output(i, proc) for i, proc in enumerate(procs)]),
+                timeout=BLENDER_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            status.update(label="Blender timed out", state="error")
+            st.error(f"Blender did not finish within {BLENDER_TIMEOUT // 60} minutes")
+            return None
         finally:
-            os.unlink(script_path)
+            # On timeout or cancellation no shard may keep rendering unread
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()
+            await asyncio.gather(*[proc.wait() for proc in procs])
+        
+        for proc, tail in zip(procs, tails):
+            if proc.returncode != 0:
+                status.update(label="Blender execution failed", state="error")
+                st.error("Blender execution failed: " + b"".join(tail).decode(errors='replace'))
+                return None
+        
+        # Join the shard videos without re-encoding. Write under a temporary
+        # name so an interrupted join never leaves a cached video behind.
+        partial_path = output_dir / "final_video.partial.mp4"
+        list_path = output_dir / "shards.txt"
+        list_path.write_text("".join(
+            f"file '{(shard_dir / 'final_video.mp4').resolve().as_posix()}'\n"
+            for shard_dir in shard_dirs
+        ), encoding="utf-8")
+        
+        concat = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-f", "concat", "-safe", "0",
+            "-i", str(list_path),
+            "-c", "copy", str(partial_path),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        _, stderr = await concat.communicate()
+        
+        if concat.returncode != 0:
+            status.update(label="Video concatenation failed", state="error")
+            st.error(f"Video concatenation failed: {stderr.decode(errors='replace')}")
+            return None
+        
+        os.replace(partial_path, video_path)
+        record_render(video_path, topic)
+        status.update(label="Render complete", state="complete")
+        return video_path
+
 
 # Initialize platform
 @st.cache_resource
 def get_platform():
     return EnhancedVideoEduPlatform()
 
+@st.cache_data(show_spinner=False)
+def _load_video_bytes(path: str, mtime: float, size: int) -> bytes:
+    """Read a rendered video once per file version instead of on every rerun"""
+    return Path(path).read_bytes()
+
+async def _pipeline(platform: EnhancedVideoEduPlatform, settings: Dict) -> Tuple[Dict, str, Optional[str]]:
+    """Analyze, design and render one topic on a single event loop"""
+    
+    analysis = await platform.analyze_topic(
+        settings["topic"],
+        settings["subject"],
+        settings["level"]
+    )
+    
+    # Probe for Blender while the scene script is being generated
+    script, _ = await asyncio.gather(
+        platform.create_3d_scene(analysis, settings["quality"]),
+        _probe_blender()
+    )
+    
+    video_path = await platform.generate_video(settings["topic"], script)
+    return analysis, script, video_path
+
+async def _hybrid_pipeline(platform: EnhancedVideoEduPlatform, settings: Dict) -> Optional[str]:
+    """Produce the 3D video, falling back to Nano Banana if it fails"""
+    
+    try:
+        _, _, video_path = await _pipeline(platform, settings)
+    except Exception:
+        video_path = None
+    
+    if video_path:
+        return video_path
+    
+    st.warning("3D generation failed, using Nano Banana...")
+    return await platform.nano_banana_platform.generate_educational_video(
+        settings["topic"],
+        settings["subject"],
+        settings["level"]
+    )
+
 # --- UI Components ---
+# Sidebar options are built once per process instead of on every rerun
+_SUBJECTS = ("Physics", "Chemistry", "Biology", "Mathematics", "History", "Geography", "Computer Science")
+_LEVELS = ("Elementary", "Middle School", "High School", "College", "Professional")
+_QUALITIES = tuple(RESOLUTIONS)
+_LANGUAGES = ("English", "Spanish", "French", "German", "Hindi")
+_METHODS = ("3D Blender (Full 3D)", "Nano Banana (Visual Workflow)", "Hybrid (Both)")
+
 def render_sidebar():
     st.sidebar.title("🎬 3D Video Edu + Nano Banana")
     st.sidebar.markdown("Create immersive 3D educational videos with AI!")
@@ -268,12 +568,12 @@ def render_sidebar():
     st.sidebar.markdown("---")
     subject = st.sidebar.selectbox(
         "Subject:",
-        ["Physics", "Chemistry", "Biology", "Mathematics", "History", "Geography", "Computer Science"]
+        _SUBJECTS
     )
     
     level = st.sidebar.selectbox(
         "Level:",
-        ["Elementary", "Middle School", "High School", "College", "Professional"]
+        _LEVELS
     )
     
     topic = st.sidebar.text_area(
@@ -284,16 +584,20 @@ def render_sidebar():
     # Video Settings
     st.sidebar.markdown("---")
     duration = st.sidebar.slider("Video Duration (seconds):", 30, 300, 120)
-    quality = st.sidebar.selectbox("Video Quality:", ["720p", "1080p", "4K"])
-    language = st.sidebar.selectbox("Language:", ["English", "Spanish", "French", "German", "Hindi"])
+    quality = st.sidebar.selectbox("Video Quality:", _QUALITIES)
+    language = st.sidebar.selectbox("Language:", _LANGUAGES)
     
     # Generation Method
     st.sidebar.markdown("---")
     generation_method = st.sidebar.radio(
         "Generation Method:",
-        ["3D Blender (Full 3D)", "Nano Banana (Visual Workflow)", "Hybrid (Both)"]
+        _METHODS
     )
     
+    # Blender detection is cached for the process; re-run it after installing Blender
+    if st.sidebar.button("🔍 Re-detect Blender"):
+        _blender_probe.clear()
+    
     return {
         "openai_key": openai_key,
         "google_key": google_key,
@@ -328,29 +632,20 @@ def render_main_content(settings):
                 
                 if settings["generation_method"] == "3D Blender (Full 3D)":
                     # Use 3D Blender method
-                    st.info("🔍 Analyzing topic and creating 3D visualization plan...")
-                    analysis = asyncio.run(platform.analyze_topic(
-                        settings["topic"],
-                        settings["subject"],
-                        settings["level"]
-                    ))
+                    st.info("🔍 Analyzing, designing and rendering the 3D video...")
+                    analysis, script, video_path = asyncio.run(_pipeline(platform, settings))
                     
                     with st.expander("📋 3D Visualization Plan", expanded=True):
                         st.json(analysis)
                     
-                    st.info("🎨 Designing 3D scene and animations...")
-                    script = asyncio.run(platform.create_3d_scene(analysis))
-                    
                     with st.expander("🐍 Blender Script", expanded=False):
                         st.code(script, language="python")
-                    
-                    st.info("🎬 Rendering 3D video...")
-                    video_path = asyncio.run(platform.generate_video(settings["topic"], script))
                 
                 elif settings["generation_method"] == "Nano Banana (Visual Workflow)":
                     # Use Nano Banana method
                     st.info("🎨 Using Nano Banana visual workflow...")
-                    video_path = asyncio.run(platform.nano_banana_platform.generate_educational_video(
+                    from nano_banana_integration import run_workflow
+                    video_path = run_workflow(platform.nano_banana_platform.generate_educational_video(
                         settings["topic"],
                         settings["subject"],
                         settings["level"]
@@ -360,42 +655,32 @@ def render_main_content(settings):
                     # Use both methods
                     st.info("🔄 Using hybrid approach with both 3D and visual workflow...")
                     
-                    # Try 3D first
-                    try:
-                        analysis = asyncio.run(platform.analyze_topic(
-                            settings["topic"],
-                            settings["subject"],
-                            settings["level"]
-                        ))
-                        script = asyncio.run(platform.create_3d_scene(analysis))
-                        video_path = asyncio.run(platform.generate_video(settings["topic"], script))
-                    except:
-                        # Fallback to Nano Banana
-                        st.warning("3D generation failed, using Nano Banana...")
-                        video_path = asyncio.run(platform.nano_banana_platform.generate_educational_video(
-                            settings["topic"],
-                            settings["subject"],
-                            settings["level"]
-                        ))
+                    # Try 3D first and fall back to Nano Banana
+                    video_path = asyncio.run(_hybrid_pipeline(platform, settings))
                 
                 if video_path:
                     st.success("✅ Educational video generated successfully!")
                     
+                    # Player and download share one cached read of the file
+                    video_bytes = None
+                    if os.path.exists(video_path):
+                        stat = os.stat(video_path)
+                        video_bytes = _load_video_bytes(video_path, stat.st_mtime, stat.st_size)
+                    
                     # Display video
                     if video_path.endswith('.mp4'):
-                        st.video(video_path)
+                        st.video(video_bytes if video_bytes is not None else video_path, format="video/mp4")
                     else:
                         st.info(f"Video generated at: {video_path}")
                     
                     # Download button
-                    if os.path.exists(video_path):
-                        with open(video_path, "rb") as file:
-                            st.download_button(
-                                label="📥 Download Video",
-                                data=file.read(),
-                                file_name=f"{settings['topic'].replace(' ', '_')}_educational_video.mp4",
-                                mime="video/mp4"
-                            )
+                    if video_bytes is not None:
+                        st.download_button(
+                            label="📥 Download Video",
+                            data=video_bytes,
+                            file_name=f"{settings['topic'].replace(' ', '_')}_educational_video.mp4",
+                            mime="video/mp4"
+                        )
                 else:
                     st.error("❌ Failed to generate video. Please try again.")
     
@@ -410,6 +695,15 @@ def render_main_content(settings):
         - **⚡ Hybrid Approach**: Combines 3D and visual workflow methods
         """)
         
+        # Renders are cached on disk, so picking one again skips Blender
+        renders = [r for r in load_render_index().values() if cached_render(r["path"])]
+        if renders:
+            st.markdown("### 🎞️ Previous Renders")
+            renders.sort(key=lambda r: r["rendered_at"], reverse=True)
+            for render in renders[:5]:
+                with st.expander(f"{render['topic']} ({render['rendered_at']})"):
+                    st.video(render["path"], format="video/mp4")
+        
         st.markdown("### 📚 Example Topics")
         st.markdown("""
         - **Physics**: Gravity, Electromagnetic fields, Wave propagation
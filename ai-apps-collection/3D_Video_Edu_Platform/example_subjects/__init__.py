@@ -0,0 +1,3 @@
+"""
+Per-subject example use cases, loaded on demand by example_use_cases
+"""
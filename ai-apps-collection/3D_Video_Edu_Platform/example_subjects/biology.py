@@ -0,0 +1,168 @@
+"""
+Biology examples for the 3D Video Educational AI Platform
+"""
+
+BIOLOGY_EXAMPLES = {
+    "cell_division": {
+        "topic": "Mitosis - Cell Division Process",
+        "subject": "Biology",
+        "level": "High School",
+        "structures": [
+            {
+                "type": "cell",
+                "name": "Parent_Cell",
+                "location": (0, 0, 0),
+                "radius": 3.0,
+                "organelles": [
+                    {
+                        "name": "Nucleus",
+                        "position": (0, 0, 0),
+                        "radius": 1.5,
+                        "color": (0.5, 0.5, 1.0, 1.0)  # Blue
+                    },
+                    {
+                        "name": "Mitochondria",
+                        "position": (1.5, 1.5, 0),
+                        "radius": 0.5,
+                        "color": (0.0, 1.0, 0.0, 1.0)  # Green
+                    },
+                    {
+                        "name": "Mitochondria_2",
+                        "position": (-1.5, -1.5, 0),
+                        "radius": 0.5,
+                        "color": (0.0, 1.0, 0.0, 1.0)  # Green
+                    }
+                ]
+            }
+        ],
+        "processes": [
+            {
+                "name": "mitosis",
+                "steps": [
+                    {
+                        "frame": 1,
+                        "description": "Interphase - Normal cell state",
+                        "transforms": {}
+                    },
+                    {
+                        "frame": 50,
+                        "description": "Prophase - Chromosomes condense",
+                        "transforms": {
+                            "Parent_Cell_Nucleus": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.2, 1.2, 1.2)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 100,
+                        "description": "Metaphase - Chromosomes align",
+                        "transforms": {
+                            "Parent_Cell_Nucleus": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.5, 1.5, 1.5)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 150,
+                        "description": "Anaphase - Chromosomes separate",
+                        "transforms": {
+                            "Parent_Cell_Nucleus": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (2.0, 0.5, 0.5)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 200,
+                        "description": "Telophase - Two nuclei form",
+                        "transforms": {
+                            "Parent_Cell_Nucleus": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 1.0, 1.0)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 250,
+                        "description": "Cytokinesis - Cell divides",
+                        "transforms": {
+                            "Parent_Cell": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 0.5, 1.0)
+                            }
+                        }
+                    }
+                ]
+            }
+        ]
+    },
+    
+    "photosynthesis": {
+        "topic": "Photosynthesis Process",
+        "subject": "Biology",
+        "level": "Middle School",
+        "structures": [
+            {
+                "type": "leaf",
+                "name": "Plant_Leaf",
+                "location": (0, 0, 0),
+                "size": (4, 6, 0.2),
+                "color": (0.0, 0.8, 0.0, 1.0)  # Green
+            },
+            {
+                "type": "sun",
+                "name": "Sunlight",
+                "location": (0, 0, 8),
+                "radius": 1.0,
+                "color": (1.0, 1.0, 0.0, 1.0)  # Yellow
+            }
+        ],
+        "processes": [
+            {
+                "name": "photosynthesis",
+                "steps": [
+                    {
+                        "frame": 1,
+                        "description": "Sunlight hits the leaf",
+                        "transforms": {
+                            "Sunlight": {
+                                "location": (0, 0, 8),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 1.0, 1.0)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 100,
+                        "description": "Chlorophyll absorbs light energy",
+                        "transforms": {
+                            "Plant_Leaf": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.2, 1.2, 1.2)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 200,
+                        "description": "Glucose and oxygen are produced",
+                        "transforms": {
+                            "Plant_Leaf": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 1.0, 1.0)
+                            }
+                        }
+                    }
+                ]
+            }
+        ]
+    }
+}
@@ -0,0 +1,79 @@
+"""
+Chemistry examples for the 3D Video Educational AI Platform
+"""
+
+CHEMISTRY_EXAMPLES = {
+    "water_molecule": {
+        "topic": "Water Molecule Structure",
+        "subject": "Chemistry",
+        "level": "High School",
+        "molecules": [
+            {
+                "name": "H2O",
+                "atoms": [
+                    {
+                        "element": "O",
+                        "position": (0, 0, 0),
+                        "radius": 0.6,
+                        "color": (1.0, 0.0, 0.0, 1.0)  # Red for Oxygen
+                    },
+                    {
+                        "element": "H",
+                        "position": (0.96, 0.25, 0),
+                        "radius": 0.3,
+                        "color": (1.0, 1.0, 1.0, 1.0)  # White for Hydrogen
+                    },
+                    {
+                        "element": "H",
+                        "position": (0.96, -0.25, 0),
+                        "radius": 0.3,
+                        "color": (1.0, 1.0, 1.0, 1.0)  # White for Hydrogen
+                    }
+                ],
+                "bonds": [
+                    {
+                        "id": 1,
+                        "center": (0.48, 0.125, 0),
+                        "length": 0.96,
+                        "rotation": (0, 0, 0)
+                    },
+                    {
+                        "id": 2,
+                        "center": (0.48, -0.125, 0),
+                        "length": 0.96,
+                        "rotation": (0, 0, 0)
+                    }
+                ]
+            }
+        ],
+        "animations": [
+            {
+                "type": "molecular_vibration",
+                "molecule": "H2O",
+                "duration": 300,
+                "frequency": 2.0
+            }
+        ]
+    },
+    
+    "dna_structure": {
+        "topic": "DNA Double Helix Structure",
+        "subject": "Chemistry",
+        "level": "College",
+        "molecules": [
+            {
+                "name": "DNA_Helix",
+                "atoms": [],  # Will be generated programmatically
+                "bonds": []   # Will be generated programmatically
+            }
+        ],
+        "animations": [
+            {
+                "type": "helix_rotation",
+                "molecule": "DNA_Helix",
+                "duration": 300,
+                "rotation_speed": 1.0
+            }
+        ]
+    }
+}
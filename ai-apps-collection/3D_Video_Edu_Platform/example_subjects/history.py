@@ -0,0 +1,80 @@
+"""
+History examples for the 3D Video Educational AI Platform
+"""
+
+HISTORY_EXAMPLES = {
+    "ancient_rome": {
+        "topic": "Ancient Roman Architecture",
+        "subject": "History",
+        "level": "High School",
+        "structures": [
+            {
+                "type": "building",
+                "name": "Colosseum",
+                "location": (0, 0, 0),
+                "size": (4, 4, 3),
+                "details": [
+                    {
+                        "name": "Arches",
+                        "position": (0, 0, 1.5),
+                        "size": (0.2, 4, 1),
+                        "color": (0.8, 0.7, 0.6, 1.0)  # Stone color
+                    },
+                    {
+                        "name": "Columns",
+                        "position": (1.5, 1.5, 0),
+                        "size": (0.3, 0.3, 3),
+                        "color": (0.9, 0.8, 0.7, 1.0)  # Marble color
+                    }
+                ]
+            },
+            {
+                "type": "monument",
+                "name": "Arch_of_Titus",
+                "location": (6, 0, 0),
+                "radius": 1,
+                "height": 3
+            }
+        ],
+        "timeline": [
+            {
+                "name": "construction_phase",
+                "steps": [
+                    {
+                        "frame": 1,
+                        "description": "Foundation laid",
+                        "transforms": {
+                            "Colosseum": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (0.1, 0.1, 0.1)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 100,
+                        "description": "Walls constructed",
+                        "transforms": {
+                            "Colosseum": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 1.0, 0.5)
+                            }
+                        }
+                    },
+                    {
+                        "frame": 200,
+                        "description": "Arches and columns added",
+                        "transforms": {
+                            "Colosseum": {
+                                "location": (0, 0, 0),
+                                "rotation": (0, 0, 0),
+                                "scale": (1.0, 1.0, 1.0)
+                            }
+                        }
+                    }
+                ]
+            }
+        ]
+    }
+}
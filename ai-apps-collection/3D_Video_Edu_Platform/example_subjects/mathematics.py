@@ -0,0 +1,83 @@
+"""
+Mathematics examples for the 3D Video Educational AI Platform
+"""
+
+MATH_EXAMPLES = {
+    "calculus_derivatives": {
+        "topic": "Calculus - Understanding Derivatives",
+        "subject": "Mathematics",
+        "level": "College",
+        "shapes": [
+            {
+                "type": "function_surface",
+                "name": "Function_Curve",
+                "equation": "y = x^2",
+                "range": (-5, 5),
+                "color": (0.0, 0.5, 1.0, 1.0)  # Blue
+            },
+            {
+                "type": "tangent_line",
+                "name": "Tangent_Line",
+                "point": (2, 4),
+                "slope": 4,
+                "color": (1.0, 0.0, 0.0, 1.0)  # Red
+            }
+        ],
+        "animations": [
+            {
+                "type": "tangent_animation",
+                "function": "Function_Curve",
+                "tangent": "Tangent_Line",
+                "duration": 300,
+                "point_movement": True
+            }
+        ]
+    },
+    
+    "geometric_proofs": {
+        "topic": "Pythagorean Theorem Proof",
+        "subject": "Mathematics",
+        "level": "High School",
+        "shapes": [
+            {
+                "type": "geometric_solid",
+                "name": "Right_Triangle",
+                "shape": "custom",
+                "vertices": [(0, 0, 0), (3, 0, 0), (0, 4, 0)],
+                "color": (0.8, 0.8, 0.8, 1.0)  # Gray
+            },
+            {
+                "type": "geometric_solid",
+                "name": "Square_A",
+                "shape": "cube",
+                "location": (0, 0, 0),
+                "size": 3,
+                "color": (1.0, 0.0, 0.0, 0.5)  # Red, semi-transparent
+            },
+            {
+                "type": "geometric_solid",
+                "name": "Square_B",
+                "shape": "cube",
+                "location": (0, 0, 0),
+                "size": 4,
+                "color": (0.0, 1.0, 0.0, 0.5)  # Green, semi-transparent
+            },
+            {
+                "type": "geometric_solid",
+                "name": "Square_C",
+                "shape": "cube",
+                "location": (0, 0, 0),
+                "size": 5,
+                "color": (0.0, 0.0, 1.0, 0.5)  # Blue, semi-transparent
+            }
+        ],
+        "animations": [
+            {
+                "type": "proof_animation",
+                "shapes": ["Square_A", "Square_B", "Square_C"],
+                "duration": 300,
+                "demonstration": "area_equality"
+            }
+        ]
+    }
+}
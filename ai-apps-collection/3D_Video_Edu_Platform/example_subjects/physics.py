@@ -0,0 +1,99 @@
+"""
+Physics examples for the 3D Video Educational AI Platform
+"""
+
+PHYSICS_EXAMPLES = {
+    "gravity_and_planetary_motion": {
+        "topic": "Gravity and Planetary Motion",
+        "subject": "Physics",
+        "level": "High School",
+        "objects": [
+            {
+                "type": "sphere",
+                "name": "Sun",
+                "location": (0, 0, 0),
+                "radius": 2.0,
+                "color": (1.0, 1.0, 0.0, 1.0)  # Yellow
+            },
+            {
+                "type": "sphere",
+                "name": "Earth",
+                "location": (8, 0, 0),
+                "radius": 0.5,
+                "color": (0.0, 0.5, 1.0, 1.0)  # Blue
+            },
+            {
+                "type": "sphere",
+                "name": "Moon",
+                "location": (9, 0, 0),
+                "radius": 0.2,
+                "color": (0.7, 0.7, 0.7, 1.0)  # Gray
+            }
+        ],
+        "animations": [
+            {
+                "object": "Earth",
+                "type": "orbit",
+                "center": (0, 0, 0),
+                "radius": 8,
+                "duration": 300,
+                "speed": 1.0
+            },
+            {
+                "object": "Moon",
+                "type": "orbit",
+                "center": (8, 0, 0),
+                "radius": 1,
+                "duration": 100,
+                "speed": 3.0
+            }
+        ],
+        "camera_movements": [
+            {
+                "frame": 1,
+                "location": (0, -15, 5),
+                "rotation": (60, 0, 0)
+            },
+            {
+                "frame": 150,
+                "location": (8, -8, 3),
+                "rotation": (45, 0, 0)
+            },
+            {
+                "frame": 300,
+                "location": (0, -15, 5),
+                "rotation": (60, 0, 0)
+            }
+        ]
+    },
+    
+    "electromagnetic_fields": {
+        "topic": "Electromagnetic Fields",
+        "subject": "Physics",
+        "level": "College",
+        "objects": [
+            {
+                "type": "sphere",
+                "name": "Positive_Charge",
+                "location": (-2, 0, 0),
+                "radius": 0.3,
+                "color": (1.0, 0.0, 0.0, 1.0)  # Red
+            },
+            {
+                "type": "sphere",
+                "name": "Negative_Charge",
+                "location": (2, 0, 0),
+                "radius": 0.3,
+                "color": (0.0, 0.0, 1.0, 1.0)  # Blue
+            }
+        ],
+        "field_lines": True,
+        "animations": [
+            {
+                "type": "field_visualization",
+                "charges": ["Positive_Charge", "Negative_Charge"],
+                "duration": 300
+            }
+        ]
+    }
+}
@@ -0,0 +1,143 @@
+"""
+Persistent exact and semantic caching for LLM outputs of the 3D Video Educational AI Platform
+"""
+
+import functools
+import hashlib
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+from diskcache import Cache
+from openai import AsyncOpenAI, OpenAIError
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.92
+
+class LLMCache:
+    def __init__(
+        self,
+        directory: str = "./.llm_cache",
+        threshold: float = SIMILARITY_THRESHOLD,
+        client: Optional[Callable[[], AsyncOpenAI]] = None
+    ):
+        self.store = Cache(directory)
+        self.threshold = threshold
+        self._client = client
+        self._embedder = None
+
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str:
+        """Build a cache key from a namespace and the call arguments"""
+        digest = hashlib.blake2b("|".join(parts).encode()).hexdigest()
+        return f"{namespace}:{digest}"
+
+    def get(self, key: str) -> Any:
+        """Return the cached result for an exact key, or None"""
+        return self.store.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result under an exact key"""
+        self.store.set(key, value)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed text with the OpenAI embedding model as a unit vector"""
+
+        if self._client is not None:
+            embedder = self._client()
+        else:
+            if self._embedder is None:
+                self._embedder = AsyncOpenAI()
+            embedder = self._embedder
+
+        response = await embedder.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def nearest(self, scope: str, vector: np.ndarray) -> Any:
+        """Return the cached result most similar to vector if it clears the threshold"""
+
+        # Read the index and the entry it points at in one transaction so a
+        # concurrent writer cannot swap the index in between
+        with self.store.transact():
+            keys, vectors = self.store.get(f"{scope}:index", ([], None))
+            if not keys:
+                return None
+
+            scores = vectors @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self.store.get(keys[best])
+
+    def remember(self, scope: str, key: str, vector: np.ndarray) -> None:
+        """Add a key and its embedding to the similarity index of a scope"""
+
+        # Concurrent sessions share the cache directory; append atomically
+        with self.store.transact():
+            keys, vectors = self.store.get(f"{scope}:index", ([], None))
+            vectors = vector[None, :] if vectors is None else np.vstack([vectors, vector])
+            self.store.set(f"{scope}:index", (keys + [key], vectors))
+
+    async def lookup(
+        self, key: str, scope: Optional[str] = None, text: Optional[str] = None
+    ) -> Tuple[Any, Optional[np.ndarray]]:
+        """Return an exact hit, else a near-duplicate of text within scope.
+
+        The embedding computed for a miss is returned alongside so the caller
+        can index the fresh result with save without embedding twice. When the
+        embedding call fails, only exact hits are served.
+        """
+
+        result = self.get(key)
+        if result is not None or scope is None:
+            return result, None
+
+        try:
+            vector = await self.embed(text)
+        except OpenAIError:
+            return None, None
+        return self.nearest(scope, vector), vector
+
+    def save(
+        self, key: str, value: Any, scope: Optional[str] = None, vector: Optional[np.ndarray] = None
+    ) -> None:
+        """Store a result and index it for near-duplicate lookups"""
+
+        self.set(key, value)
+        if vector is not None:
+            self.remember(scope, key, vector)
+
+def cached_llm_call(
+    namespace: str,
+    key_parts: Callable[..., Tuple[str, ...]],
+    semantic: Optional[Callable[..., Tuple[str, str]]] = None
+):
+    """Memoize an async LLM method in its instance's llm_cache.
+
+    key_parts maps the call arguments to the exact-match key. semantic, when
+    given, maps them to a (scope, text) pair used for near-duplicate lookups
+    within that scope before the LLM is called.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self.llm_cache
+            key = cache.make_key(namespace, *key_parts(*args, **kwargs))
+
+            scope = text = None
+            if semantic is not None:
+                scope, text = semantic(*args, **kwargs)
+                scope = f"{namespace}:{scope}"
+
+            result, vector = await cache.lookup(key, scope, text)
+            if result is not None:
+                return result
+
+            result = await func(self, *args, **kwargs)
+            cache.save(key, result, scope, vector)
+            return result
+
+        return wrapper
+
+    return decorator
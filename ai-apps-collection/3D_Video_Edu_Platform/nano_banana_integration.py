@@ -5,18 +5,191 @@ Combines the visual workflow builder with educational video generation
 
 import streamlit as st
 import asyncio
-import json
-import base64
 from pathlib import Path
 from typing import Dict, List, Optional
-import tempfile
-import os
-from datetime import datetime
-import subprocess
-import shutil
-import requests
-from io import BytesIO
-from PIL import Image
+from types import MappingProxyType
+import orjson
+import hashlib
+import functools
+from diskcache import Cache
+
+# Most generateImage prompts sent to Nano Banana in one request
+MAX_BATCH_SIZE = 8
+
+# Generated images are shown side by side in rows of this many
+IMAGE_GRID_COLUMNS = 4
+
+# Generated images are cached by prompt across runs, up to IMAGE_CACHE_SIZE
+IMAGE_CACHE_DIR = "./.nano_cache"
+IMAGE_CACHE_SIZE = 4 * 2**30
+
+def image_cache_key(node: Dict) -> str:
+    return hashlib.blake2b(f"{node['type']}|{node['prompt']}".encode()).hexdigest()
+
+def content_id(*parts: str) -> str:
+    """Short id derived from node content, identical for identical content"""
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=6).hexdigest()
+
+# Characters that would break or nest output paths built from a topic
+_SLUG_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_", ":": "_"})
+
+@functools.lru_cache(maxsize=128)
+def _slug(topic: str) -> str:
+    return topic.translate(_SLUG_TABLE)
+
+def run_workflow(coro):
+    """Run a Nano Banana coroutine on its own event loop, uvloop where installed.
+
+    The loop is chosen here rather than through the global loop policy, so
+    importing this module leaves every other asyncio user on its own loop.
+    """
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+def placeholder_image(label: str) -> bytes:
+    """Render a labelled PNG standing in for a Nano Banana image"""
+    # PIL is only needed for mock images, so it is not imported up front
+    from io import BytesIO
+    from PIL import Image, ImageDraw
+    
+    image = Image.new("RGB", (512, 288), (102, 126, 234))
+    ImageDraw.Draw(image).text((16, 16), label, fill=(255, 255, 255))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+def _freeze_templates(templates: Dict) -> MappingProxyType:
+    """Make every template read-only, down to its nodes and edges.
+    
+    Nodes and edges become tuples of read-only mappings, so a per-request
+    copy is one shallow `dict(node, prompt=...)` per node, not a deepcopy.
+    """
+    return MappingProxyType({
+        subject: MappingProxyType({
+            **template,
+            "nodes": tuple(
+                MappingProxyType({**node, "position": MappingProxyType(node["position"])})
+                for node in template["nodes"]
+            ),
+            "edges": tuple(MappingProxyType(edge) for edge in template["edges"])
+        })
+        for subject, template in templates.items()
+    })
+
+# Educational workflow templates, built once and shared read-only by every platform
+_WORKFLOW_TEMPLATES = _freeze_templates({
+    "physics": {
+        "name": "Physics Visualization Workflow",
+        "nodes": [
+            {
+                "type": "generateImage",
+                "id": "concept_visualization",
+                "prompt": "Create a 3D scientific illustration showing {concept} with clear labels and educational annotations",
+                "position": {"x": 100, "y": 100}
+            },
+            {
+                "type": "editImage",
+                "id": "add_annotations",
+                "prompt": "Add educational labels, arrows, and explanations to make this diagram more educational",
+                "position": {"x": 400, "y": 100}
+            },
+            {
+                "type": "generateImage",
+                "id": "animation_frame_1",
+                "prompt": "Create the first frame of an animation showing {concept} in action",
+                "position": {"x": 100, "y": 300}
+            },
+            {
+                "type": "generateImage",
+                "id": "animation_frame_2",
+                "prompt": "Create the second frame of an animation showing {concept} in action",
+                "position": {"x": 300, "y": 300}
+            },
+            {
+                "type": "generateImage",
+                "id": "animation_frame_3",
+                "prompt": "Create the third frame of an animation showing {concept} in action",
+                "position": {"x": 500, "y": 300}
+            }
+        ],
+        "edges": [
+            {"source": "concept_visualization", "target": "add_annotations"},
+            {"source": "animation_frame_1", "target": "animation_frame_2"},
+            {"source": "animation_frame_2", "target": "animation_frame_3"}
+        ]
+    },
+    "chemistry": {
+        "name": "Chemistry Molecular Visualization",
+        "nodes": [
+            {
+                "type": "generateImage",
+                "id": "molecular_structure",
+                "prompt": "Create a 3D molecular structure diagram of {molecule} with accurate bond angles and atom colors",
+                "position": {"x": 100, "y": 100}
+            },
+            {
+                "type": "editImage",
+                "id": "add_bond_labels",
+                "prompt": "Add bond type labels, electron pairs, and molecular geometry annotations",
+                "position": {"x": 400, "y": 100}
+            },
+            {
+                "type": "generateImage",
+                "id": "reaction_mechanism",
+                "prompt": "Create a step-by-step reaction mechanism diagram showing {reaction}",
+                "position": {"x": 100, "y": 300}
+            }
+        ],
+        "edges": [
+            {"source": "molecular_structure", "target": "add_bond_labels"}
+        ]
+    },
+    "biology": {
+        "name": "Biology Process Visualization",
+        "nodes": [
+            {
+                "type": "generateImage",
+                "id": "cell_structure",
+                "prompt": "Create a detailed cross-section of a {cell_type} showing all organelles and their functions",
+                "position": {"x": 100, "y": 100}
+            },
+            {
+                "type": "editImage",
+                "id": "highlight_process",
+                "prompt": "Highlight the {process} pathway with arrows and color coding",
+                "position": {"x": 400, "y": 100}
+            },
+            {
+                "type": "generateImage",
+                "id": "process_animation_1",
+                "prompt": "Create the first stage of {process} with clear visual indicators",
+                "position": {"x": 100, "y": 300}
+            },
+            {
+                "type": "generateImage",
+                "id": "process_animation_2",
+                "prompt": "Create the second stage of {process} with clear visual indicators",
+                "position": {"x": 300, "y": 300}
+            }
+        ],
+        "edges": [
+            {"source": "cell_structure", "target": "highlight_process"},
+            {"source": "process_animation_1", "target": "process_animation_2"}
+        ]
+    }
+})
 
 class NanoBananaVideoEduPlatform:
     def __init__(self):
@@ -61,110 +234,20 @@ class NanoBananaVideoEduPlatform:
         """Setup Nano Banana integration"""
         self.nano_banana_url = "http://localhost:3000"  # Default Nano Banana URL
         self.workflow_templates = self.load_workflow_templates()
+        
+        self.image_cache = Cache(
+            IMAGE_CACHE_DIR,
+            size_limit=IMAGE_CACHE_SIZE,
+            eviction_policy="least-recently-used"
+        )
+        
+        # Videos are written here; created once rather than on every video
+        self._out_dir = Path("output")
+        self._out_dir.mkdir(exist_ok=True)
     
     def load_workflow_templates(self):
         """Load educational workflow templates"""
-        return {
-            "physics": {
-                "name": "Physics Visualization Workflow",
-                "nodes": [
-                    {
-                        "type": "generateImage",
-                        "id": "concept_visualization",
-                        "prompt": "Create a 3D scientific illustration showing {concept} with clear labels and educational annotations",
-                        "position": {"x": 100, "y": 100}
-                    },
-                    {
-                        "type": "editImage",
-                        "id": "add_annotations",
-                        "prompt": "Add educational labels, arrows, and explanations to make this diagram more educational",
-                        "position": {"x": 400, "y": 100}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "animation_frame_1",
-                        "prompt": "Create the first frame of an animation showing {concept} in action",
-                        "position": {"x": 100, "y": 300}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "animation_frame_2",
-                        "prompt": "Create the second frame of an animation showing {concept} in action",
-                        "position": {"x": 300, "y": 300}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "animation_frame_3",
-                        "prompt": "Create the third frame of an animation showing {concept} in action",
-                        "position": {"x": 500, "y": 300}
-                    }
-                ],
-                "edges": [
-                    {"source": "concept_visualization", "target": "add_annotations"},
-                    {"source": "animation_frame_1", "target": "animation_frame_2"},
-                    {"source": "animation_frame_2", "target": "animation_frame_3"}
-                ]
-            },
-            "chemistry": {
-                "name": "Chemistry Molecular Visualization",
-                "nodes": [
-                    {
-                        "type": "generateImage",
-                        "id": "molecular_structure",
-                        "prompt": "Create a 3D molecular structure diagram of {molecule} with accurate bond angles and atom colors",
-                        "position": {"x": 100, "y": 100}
-                    },
-                    {
-                        "type": "editImage",
-                        "id": "add_bond_labels",
-                        "prompt": "Add bond type labels, electron pairs, and molecular geometry annotations",
-                        "position": {"x": 400, "y": 100}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "reaction_mechanism",
-                        "prompt": "Create a step-by-step reaction mechanism diagram showing {reaction}",
-                        "position": {"x": 100, "y": 300}
-                    }
-                ],
-                "edges": [
-                    {"source": "molecular_structure", "target": "add_bond_labels"}
-                ]
-            },
-            "biology": {
-                "name": "Biology Process Visualization",
-                "nodes": [
-                    {
-                        "type": "generateImage",
-                        "id": "cell_structure",
-                        "prompt": "Create a detailed cross-section of a {cell_type} showing all organelles and their functions",
-                        "position": {"x": 100, "y": 100}
-                    },
-                    {
-                        "type": "editImage",
-                        "id": "highlight_process",
-                        "prompt": "Highlight the {process} pathway with arrows and color coding",
-                        "position": {"x": 400, "y": 100}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "process_animation_1",
-                        "prompt": "Create the first stage of {process} with clear visual indicators",
-                        "position": {"x": 100, "y": 300}
-                    },
-                    {
-                        "type": "generateImage",
-                        "id": "process_animation_2",
-                        "prompt": "Create the second stage of {process} with clear visual indicators",
-                        "position": {"x": 300, "y": 300}
-                    }
-                ],
-                "edges": [
-                    {"source": "cell_structure", "target": "highlight_process"},
-                    {"source": "process_animation_1", "target": "process_animation_2"}
-                ]
-            }
-        }
+        return _WORKFLOW_TEMPLATES
     
     async def analyze_educational_topic(self, topic: str, subject: str, level: str) -> Dict:
         """Analyze topic and create visual workflow plan"""
@@ -216,9 +299,6 @@ class NanoBananaVideoEduPlatform:
     def create_nano_banana_workflow(self, analysis: Dict) -> Dict:
         """Create Nano Banana workflow from educational analysis"""
         
-        subject = analysis.get("subject", "general").lower()
-        template = self.workflow_templates.get(subject, self.workflow_templates["physics"])
-        
         # Customize template with topic-specific prompts
         workflow = {
             "name": f"Educational Workflow: {analysis['topic']}",
@@ -226,73 +306,122 @@ class NanoBananaVideoEduPlatform:
             "edges": []
         }
         
+        # Node ids come from their content, so a repeated prompt maps to the
+        # node already in the workflow instead of a second copy. An edit's id
+        # also covers the image it edits, since the same edit prompt on a
+        # different image is a different node.
+        seen = set()
+        
         # Generate nodes based on analysis
         for i, concept in enumerate(analysis["concepts"]):
+            # Each id and prompt is formatted once and shared by every field using it
+            annotate_prompt = f"Add educational annotations: {', '.join(concept['annotations'])}"
+            concept_id = f"gen_{content_id(concept['image_prompt'])}"
+            annotate_id = f"edit_{content_id(concept_id, annotate_prompt)}"
+            x = 100 + i * 300
+            
+            if annotate_id in seen:
+                continue
+            seen.add(annotate_id)
+            
             # Main concept visualization
-            workflow["nodes"].append({
-                "type": "generateImage",
-                "id": f"concept_{i}",
-                "prompt": concept["image_prompt"],
-                "position": {"x": 100 + i * 300, "y": 100},
-                "data": {
+            if concept_id not in seen:
+                seen.add(concept_id)
+                workflow["nodes"].append({
+                    "type": "generateImage",
+                    "id": concept_id,
                     "prompt": concept["image_prompt"],
-                    "concept": concept["name"]
-                }
-            })
+                    "position": {"x": x, "y": 100},
+                    "data": {
+                        "prompt": concept["image_prompt"],
+                        "concept": concept["name"]
+                    }
+                })
             
             # Add annotations
             workflow["nodes"].append({
                 "type": "editImage",
-                "id": f"annotate_{i}",
-                "prompt": f"Add educational annotations: {', '.join(concept['annotations'])}",
-                "position": {"x": 100 + i * 300, "y": 300},
+                "id": annotate_id,
+                "prompt": annotate_prompt,
+                "position": {"x": x, "y": 300},
                 "data": {
-                    "prompt": f"Add educational annotations: {', '.join(concept['annotations'])}"
+                    "prompt": annotate_prompt
                 }
             })
             
             # Connect nodes
             workflow["edges"].append({
-                "source": f"concept_{i}",
-                "target": f"annotate_{i}"
+                "source": concept_id,
+                "target": annotate_id
             })
         
         return workflow
     
-    async def execute_nano_banana_workflow(self, workflow: Dict) -> List[str]:
-        """Execute Nano Banana workflow and return generated images"""
+    async def call_node(self, node: Dict) -> Optional[bytes]:
+        """Run one workflow node and return its image bytes, if it produces one"""
+        
+        # This would integrate with the actual Nano Banana API and return the
+        # response body as is. For now, return mock results
+        if node["type"] == "generateImage":
+            # Mock image generation
+            return placeholder_image(f"mock image {node['id']}")
+        elif node["type"] == "editImage":
+            # Mock image editing
+            return placeholder_image(f"mock edited {node['id']}")
+        return None
+    
+    async def generate_images(self, nodes: List[Dict]) -> List[bytes]:
+        """Generate the images of a batch of generateImage nodes in one request"""
         
-        # This would integrate with the actual Nano Banana API
+        # This would POST the batch's prompts to the Nano Banana batch endpoint
         # For now, return mock results
-        generated_images = []
+        return [placeholder_image(f"mock image {node['id']}") for node in nodes]
+    
+    async def execute_nano_banana_workflow(self, workflow: Dict) -> List[bytes]:
+        """Execute Nano Banana workflow and return generated image bytes"""
+        
+        nodes = workflow["nodes"]
+        images = [None] * len(nodes)
         
-        for node in workflow["nodes"]:
+        # A generated image depends only on its prompt, so earlier results are
+        # reused. Edits also depend on their input image and are never cached.
+        generate = []
+        for i, node in enumerate(nodes):
             if node["type"] == "generateImage":
-                # Mock image generation
-                image_url = f"mock_image_{node['id']}.jpg"
-                generated_images.append(image_url)
-            elif node["type"] == "editImage":
-                # Mock image editing
-                image_url = f"mock_edited_{node['id']}.jpg"
-                generated_images.append(image_url)
-        
-        return generated_images
+                images[i] = self.image_cache.get(image_cache_key(node))
+                if images[i] is None:
+                    generate.append(i)
+        
+        # The rest goes out in concurrent batches of MAX_BATCH_SIZE prompts
+        batches = [generate[i:i + MAX_BATCH_SIZE] for i in range(0, len(generate), MAX_BATCH_SIZE)]
+        results = await asyncio.gather(*[
+            self.generate_images([nodes[i] for i in batch]) for batch in batches
+        ])
+        for batch, batch_images in zip(batches, results):
+            for i, image in zip(batch, batch_images):
+                images[i] = image
+                self.image_cache.set(image_cache_key(nodes[i]), image)
+        
+        # Edits work on generated images, so they start once every batch is back
+        rest = [i for i, node in enumerate(nodes) if node["type"] != "generateImage"]
+        results = await asyncio.gather(*[self.call_node(nodes[i]) for i in rest])
+        for i, image in zip(rest, results):
+            images[i] = image
+        
+        # Images stay in node order
+        return [image for image in images if image is not None]
     
-    def create_video_from_images(self, images: List[str], topic: str) -> str:
+    def create_video_from_images(self, images: List[bytes], topic: str) -> str:
         """Create video from generated images"""
         
         # This would use FFmpeg to create video from images
         # For now, return a mock video path
-        video_path = f"output/{topic.replace(' ', '_')}_nano_banana_video.mp4"
-        
-        # Create output directory
-        os.makedirs(os.path.dirname(video_path), exist_ok=True)
+        video_path = self._out_dir / f"{_slug(topic)}_nano_banana_video.mp4"
         
         # Mock video creation
-        with open(video_path, 'w') as f:
-            f.write("Mock video content")
+        video_path.write_bytes(b"Mock video content")
         
-        return video_path
+        return str(video_path)
     
     async def generate_educational_video(self, topic: str, subject: str, level: str) -> str:
         """Main method to generate educational video using Nano Banana"""
@@ -307,15 +436,18 @@ class NanoBananaVideoEduPlatform:
         
         # Display workflow
         with st.expander("📋 Visual Workflow Plan", expanded=True):
-            st.json(workflow)
+            # Pre-serialized with orjson instead of st.json's encoder
+            st.code(_dumps(workflow), language="json")
         
         # Step 3: Execute workflow
         st.info("🖼️ Generating educational images...")
         images = await self.execute_nano_banana_workflow(workflow)
         
-        # Display generated images
-        for i, image in enumerate(images):
-            st.image(image, caption=f"Generated Image {i+1}")
+        # Display generated images in one grid, up to IMAGE_GRID_COLUMNS per row
+        if images:
+            cols = st.columns(min(len(images), IMAGE_GRID_COLUMNS))
+            for i, image in enumerate(images):
+                cols[i % len(cols)].image(image, caption=f"Generated Image {i+1}")
         
         # Step 4: Create video
         st.info("🎬 Creating educational video...")
@@ -370,11 +502,15 @@ def render_nano_banana_integration():
         else:
             st.warning("⚠️ Start Nano Banana first")
 
+@st.cache_resource
+def get_nano_banana_platform():
+    return NanoBananaVideoEduPlatform()
+
 def integrate_with_main_app():
     """Integrate Nano Banana with the main 3D Video Edu Platform"""
     
     # Add Nano Banana integration to the main app
-    platform = NanoBananaVideoEduPlatform()
+    platform = get_nano_banana_platform()
     
     # Add to sidebar
     st.sidebar.markdown("---")
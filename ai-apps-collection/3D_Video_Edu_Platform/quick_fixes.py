@@ -4,34 +4,40 @@ Quick fixes to make the 3D Video Educational AI Platform 100% functional
 
 import streamlit as st
 import asyncio
-import json
 import base64
 from pathlib import Path
 from typing import Dict, List, Optional
 import tempfile
 import os
 from datetime import datetime
-import subprocess
 import shutil
+import functools
+import html
+import string
+import orjson
 
+# Characters that would break or nest output paths built from a topic
+_SLUG_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_", ":": "_"})
+
+@functools.lru_cache(maxsize=128)
+def _slug(topic: str) -> str:
+    return topic.translate(_SLUG_TABLE)
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# Tool checks run once per process; installing a tool needs an app restart
 # Check if Blender is available
+@functools.lru_cache(maxsize=1)
 def check_blender_installation():
     """Check if Blender is properly installed"""
-    try:
-        result = subprocess.run(['blender', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        return result.returncode == 0
-    except:
-        return False
+    # A PATH lookup is enough; nothing here needs the version string
+    return shutil.which('blender') is not None
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg_installation():
     """Check if FFmpeg is available for video processing"""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=10)
-        return result.returncode == 0
-    except:
-        return False
+    return shutil.which('ffmpeg') is not None
 
 # Fallback video generation using existing tools
 def create_fallback_video(topic: str, analysis: dict) -> str:
@@ -53,7 +59,7 @@ def create_fallback_video(topic: str, analysis: dict) -> str:
         Create an educational video about: {topic}
         
         Key concepts to visualize:
-        {json.dumps(analysis.get('concepts', []), indent=2)}
+        {_dumps(analysis.get('concepts', []))}
         
         Make it educational, clear, and engaging for students.
         Use 3D-style visuals and animations.
@@ -65,7 +71,7 @@ def create_fallback_video(topic: str, analysis: dict) -> str:
         response = model.generate_content(video_prompt)
         
         # Save video
-        output_path = f"output/{topic.replace(' ', '_')}_fallback_video.mp4"
+        output_path = f"output/{_slug(topic)}_fallback_video.mp4"
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # For now, create a placeholder
@@ -75,68 +81,61 @@ def create_fallback_video(topic: str, analysis: dict) -> str:
         st.error(f"Video generation failed: {e}")
         return create_mock_video(topic)
 
-def create_mock_video(topic: str) -> str:
-    """Create a mock video for demonstration purposes"""
-    
-    # Create output directory
-    output_dir = f"output/{topic.replace(' ', '_')}"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Create a simple HTML5 video placeholder
-    video_html = f"""
+# HTML5 video placeholder, parsed once; the topic is its only placeholder
+_VIDEO_HTML_TMPL = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
-        <title>3D Educational Video - {topic}</title>
+        <title>3D Educational Video - $topic</title>
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                 color: white;
                 text-align: center;
                 padding: 50px;
-            }}
-            .video-container {{
+            }
+            .video-container {
                 background: rgba(255,255,255,0.1);
                 border-radius: 20px;
                 padding: 40px;
                 margin: 20px auto;
                 max-width: 800px;
-            }}
-            .topic {{
+            }
+            .topic {
                 font-size: 2.5em;
                 margin-bottom: 20px;
                 text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            }}
-            .description {{
+            }
+            .description {
                 font-size: 1.2em;
                 margin-bottom: 30px;
                 opacity: 0.9;
-            }}
-            .coming-soon {{
+            }
+            .coming-soon {
                 font-size: 1.5em;
                 color: #ffd700;
                 margin-top: 30px;
-            }}
-            .features {{
+            }
+            .features {
                 display: grid;
                 grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
                 gap: 20px;
                 margin-top: 40px;
-            }}
-            .feature {{
+            }
+            .feature {
                 background: rgba(255,255,255,0.1);
                 padding: 20px;
                 border-radius: 10px;
                 border: 1px solid rgba(255,255,255,0.2);
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="video-container">
-            <div class="topic">🎬 {topic}</div>
+            <div class="topic">🎬 $topic</div>
             <div class="description">
-                This 3D educational video will demonstrate the key concepts of {topic} 
+                This 3D educational video will demonstrate the key concepts of $topic 
                 through immersive visualizations and animations.
             </div>
             
@@ -165,12 +164,21 @@ def create_mock_video(topic: str) -> str:
         </div>
     </body>
     </html>
-    """
+    """)
+
+def create_mock_video(topic: str) -> str:
+    """Create a mock video for demonstration purposes"""
+    
+    # Create output directory
+    output_dir = f"output/{_slug(topic)}"
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Create a simple HTML5 video placeholder
+    video_html = _VIDEO_HTML_TMPL.substitute(topic=html.escape(topic))
     
     # Save HTML file
     html_path = f"{output_dir}/video_preview.html"
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(video_html)
+    Path(html_path).write_text(video_html, encoding='utf-8')
     
     # Create a simple MP4 placeholder (you could use a real video here)
     return html_path
@@ -0,0 +1,168 @@
+"""
+Pool of keep-alive Blender render workers for the 3D Video Educational AI Platform
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, List, Optional
+
+WORKER_SCRIPT = Path(__file__).with_name("blender_worker.py")
+DONE_SENTINEL = "__EDU_RENDER_DONE__"
+FAILED_SENTINEL = "__EDU_RENDER_FAILED__"
+
+# Lines Blender prints once per rendered frame; everything else on stdout is
+# dropped as soon as it is read and only the tail of stderr is kept
+FRAME_MARKERS = ("Append frame", "Saved:")
+STDERR_TAIL = 200
+
+_job_ids = itertools.count()
+
+def _resolve(future: asyncio.Future, frames: Optional[int]) -> None:
+    if not future.done():
+        future.set_result(frames)
+
+class BlenderWorker:
+    """One long-lived Blender process, optionally pinned to a GPU, running one job at a time.
+
+    The process outlives the event loop of any single Streamlit run, so its
+    pipes are read by threads that hand results back to the waiting loop.
+    """
+
+    def __init__(self, device: Optional[int] = None):
+        self.device = device
+        self._lock = threading.Lock()
+        self._job = None
+        self._stderr = deque(maxlen=STDERR_TAIL)
+        self.start()
+
+    def start(self) -> None:
+        """Launch Blender with the job loop script"""
+
+        env = os.environ.copy()
+        if self.device is not None:
+            env["CUDA_VISIBLE_DEVICES"] = str(self.device)
+
+        self.process = subprocess.Popen(
+            ["blender", "--background", "--python", str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env
+        )
+        threading.Thread(target=self._read_stdout, args=(self.process,), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(self.process,), daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def stderr_tail(self) -> str:
+        return "".join(self._stderr)
+
+    async def run(self, path: str, module: str, args: List[str],
+                  on_frame: Callable[[], None]) -> Optional[int]:
+        """Render a cached script module; returns its frame count, or None on failure"""
+
+        loop = asyncio.get_running_loop()
+
+        # The worker is shared by every run's event loop, so it is guarded by a
+        # thread lock. If this run is cancelled while waiting, the executor
+        # thread still takes the lock later; hand it back as soon as it does.
+        acquire = loop.run_in_executor(None, self._lock.acquire)
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            acquire.add_done_callback(lambda _: self._lock.release())
+            raise
+
+        try:
+            if not self.alive:
+                self.start()
+
+            job_id = str(next(_job_ids))
+            future = loop.create_future()
+            self._stderr.clear()
+            self._job = (loop, job_id, future, on_frame)
+
+            job = {"id": job_id, "path": path, "module": module, "args": args}
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            try:
+                return await future
+            except asyncio.CancelledError:
+                # Blender is still rendering the abandoned job; stop it so its
+                # output never reaches the next job, which starts a fresh process
+                self.process.kill()
+                self.process.wait()
+                raise
+        finally:
+            self._job = None
+            self._lock.release()
+
+    def _notify(self, callback, *args) -> None:
+        job = self._job
+        if job is not None:
+            try:
+                job[0].call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                # The run that submitted the job has already closed its loop
+                pass
+
+    def _read_stdout(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            job = self._job
+            # A killed process's last lines never count toward a later job
+            if job is None or process is not self.process:
+                continue
+            _, job_id, future, on_frame = job
+
+            if line.startswith(FRAME_MARKERS):
+                self._notify(on_frame)
+            elif line.startswith((DONE_SENTINEL, FAILED_SENTINEL)):
+                sentinel, done_id, *rest = line.split()
+                if done_id == job_id:
+                    frames = int(rest[0]) if sentinel == DONE_SENTINEL else None
+                    self._notify(_resolve, future, frames)
+
+        # Blender exited; fail whatever job was still waiting on it
+        job = self._job
+        if job is not None and process is self.process:
+            self._notify(_resolve, job[2], None)
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            self._stderr.append(line)
+
+    def close(self) -> None:
+        """Let Blender finish its job loop and exit"""
+
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+class BlenderWorkerPool:
+    """One warm Blender worker per render device"""
+
+    def __init__(self, devices: int):
+        self.workers = [
+            BlenderWorker(device if devices > 1 else None) for device in range(devices)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.workers)
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
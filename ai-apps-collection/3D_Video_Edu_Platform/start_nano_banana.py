@@ -5,22 +5,30 @@ Script to start Nano Banana alongside the 3D Video Educational AI Platform
 
 import subprocess
 import time
-import os
 import sys
 import signal
 import threading
 from pathlib import Path
 
+APP_DIR = Path(__file__).parent
+
 class NanoBananaManager:
     def __init__(self):
         self.nano_banana_process = None
         self.streamlit_process = None
         self.running = False
+        self.log_files = []
+    
+    def open_log(self, name):
+        """Open an append-only log file for a child process's output"""
+        log_file = open(APP_DIR / name, "ab", buffering=0)
+        self.log_files.append(log_file)
+        return log_file
     
     def start_nano_banana(self):
         """Start Nano Banana development server"""
         try:
-            nano_banana_path = Path(__file__).parent.parent / "nano-banana-image-workflow-nextjs"
+            nano_banana_path = APP_DIR.parent / "nano-banana-image-workflow-nextjs"
             
             if not nano_banana_path.exists():
                 print("❌ Nano Banana directory not found!")
@@ -29,15 +37,14 @@ class NanoBananaManager:
             
             print("🚀 Starting Nano Banana...")
             
-            # Change to Nano Banana directory
-            os.chdir(nano_banana_path)
-            
-            # Start Nano Banana
+            # Start Nano Banana from its own directory. Output goes to a log
+            # file, since pipes nobody reads would stall it once full.
+            log_file = self.open_log("nano_banana.log")
             self.nano_banana_process = subprocess.Popen(
                 ["npm", "run", "dev"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                cwd=nano_banana_path,
+                stdout=log_file,
+                stderr=subprocess.STDOUT
             )
             
             # Wait a moment for it to start
@@ -48,7 +55,7 @@ class NanoBananaManager:
                 print("🌐 Nano Banana running at: http://localhost:3000")
                 return True
             else:
-                print("❌ Failed to start Nano Banana")
+                print("❌ Failed to start Nano Banana (see nano_banana.log)")
                 return False
                 
         except Exception as e:
@@ -61,11 +68,12 @@ class NanoBananaManager:
             print("🚀 Starting 3D Video Educational AI Platform...")
             
             # Start Streamlit
+            log_file = self.open_log("streamlit.log")
             self.streamlit_process = subprocess.Popen(
                 ["streamlit", "run", "enhanced_app.py", "--server.port=8501"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                cwd=APP_DIR,
+                stdout=log_file,
+                stderr=subprocess.STDOUT
             )
             
             # Wait a moment for it to start
@@ -76,7 +84,7 @@ class NanoBananaManager:
                 print("🌐 3D Video Edu Platform running at: http://localhost:8501")
                 return True
             else:
-                print("❌ Failed to start Streamlit")
+                print("❌ Failed to start Streamlit (see streamlit.log)")
                 return False
                 
         except Exception as e:
@@ -87,6 +95,9 @@ class NanoBananaManager:
         """Stop all running processes"""
         print("\n🛑 Stopping processes...")
         
+        # Cleared first so the exit watchers know these exits are expected
+        self.running = False
+        
         if self.nano_banana_process:
             self.nano_banana_process.terminate()
             print("✅ Nano Banana stopped")
@@ -95,28 +106,33 @@ class NanoBananaManager:
             self.streamlit_process.terminate()
             print("✅ Streamlit stopped")
         
-        self.running = False
+        for log_file in self.log_files:
+            log_file.close()
+        self.log_files = []
     
     def monitor_processes(self):
         """Monitor running processes"""
-        while self.running:
-            try:
-                # Check Nano Banana
-                if self.nano_banana_process and self.nano_banana_process.poll() is not None:
-                    print("⚠️ Nano Banana stopped unexpectedly")
-                    self.running = False
-                    break
-                
-                # Check Streamlit
-                if self.streamlit_process and self.streamlit_process.poll() is not None:
-                    print("⚠️ Streamlit stopped unexpectedly")
-                    self.running = False
-                    break
-                
-                time.sleep(1)
-                
-            except KeyboardInterrupt:
-                break
+        
+        # One thread per child blocks in wait(), so an exit is noticed the
+        # moment it happens instead of on the next one-second poll
+        stopped = threading.Event()
+        
+        def watch(name, process):
+            process.wait()
+            if self.running:
+                print(f"⚠️ {name} stopped unexpectedly")
+                self.running = False
+            stopped.set()
+        
+        for name, process in (("Nano Banana", self.nano_banana_process),
+                              ("Streamlit", self.streamlit_process)):
+            if process:
+                threading.Thread(target=watch, args=(name, process), daemon=True).start()
+        
+        try:
+            stopped.wait()
+        except KeyboardInterrupt:
+            pass
     
     def run(self):
         """Run both applications"""